@@ -1,95 +1,110 @@
 import sys
 
-from . import pytorch_compat
-pytorch_compat.apply_patches()
-
 from rich.console import Console
-from .hardware import get_compute_device
 from .utils.args import parse_arguments
 from .utils.selections import select_container_mode, select_run_mode, select_pointsync_mode
-from .utils.config import load_config
-from .api.api import run_apimode
-from .core.audiosync.audiosync import run_audiosync
-from .core.pointsync.pointsync import run_pointsync
-from .core.translate.translate import run_translation
-from .core.transcribe.transcribe import run_transcription
-from .core.container.container import run_container_tasks
-from .core.referencesync.referencesync import run_referencesync
-from .core.clean.clean import run_clean_fix
-from .core.burn.burn import run_burn
-from .core.convert.convert import run_convert
-from .core.download.download import run_download
-from . import __version__
+from .utils.config import load_config, resolve_config
+from . import __version__, _suppress_noise
 
 console = Console()
 
 SUPPORTED_EXTENSIONS = {".srt", ".ass", ".vtt", ".sub"}
 
+# Interactive modes that never load a model, so they skip torch and the hardware check
+NO_MODEL_MODES = {"container", "clean_fix", "convert", "download"}
+
+# Heavy task modules (torch, whisperx, ctranslate2...) are imported inside the
+# branch that needs them so unrelated modes don't pay their import cost.
+
 def main():
     args = parse_arguments()
+    _suppress_noise()
 
     try:
         console.clear()
         console.print(f"[bold blue]⚓ Anchor Subtitle Sync {__version__}[/bold blue]\n")
 
         config = load_config()
-        hw_overrides = config.get("hardware_overrides", {})
+        overrides = resolve_config(args, config)
 
-        final_audio_model = args.audio_model or hw_overrides.get("audio_model")
-        final_batch_size = args.batch_size or hw_overrides.get("batch_size")
-        final_translation_model = args.translation_model or hw_overrides.get("translation_model")
+        # Interactive mode: pick the task first, so we know whether it needs the hardware check
+        mode = None
+        if not (args.api or args.subtitle or args.download or args.video):
+            mode = select_run_mode()
 
         # Hardware Check
-        device, compute_type, batch_size, model_size, translation_model = get_compute_device(force_model=final_audio_model, force_batch=final_batch_size, force_translation_model=final_translation_model, force_cpu=args.cpu)
-        console.print(f"[dim]Engine configured for: [bold white]{device}[/bold white] (model: {model_size}, precision: {compute_type}, batch size: {batch_size}, translation model: {translation_model})[/dim]\n")
+        # Importing torch and probing the GPU takes seconds, so only the modes that run a model
+        # pay for it (convert resolves the device itself once it actually hits an image subtitle)
+        # -d only takes effect when neither --api nor -s is given (same order as the dispatch below)
+        download_only = args.download and not (args.api or args.subtitle)
+        if not download_only and mode not in NO_MODEL_MODES:
+            from .hardware import get_compute_device
+            device, compute_type, batch_size, model_size, translation_model = get_compute_device(force_model=overrides.audio_model, force_batch=overrides.batch_size, force_translation_model=overrides.translation_model, force_cpu=args.cpu)
+            console.print(f"[dim]Engine configured for: [bold white]{device}[/bold white] (model: {model_size}, precision: {compute_type}, batch size: {batch_size}, translation model: {translation_model})[/dim]\n")
 
         # Check if it should run in unattended mode
         # If -s / --subtitle is porvided, it will run in unattended mode.
         if args.api:
+            from .api.api import run_apimode
             run_apimode(args, device, model_size, compute_type, batch_size, translation_model, console, config)           
         elif args.subtitle:
             # If -v / --video is provided together with -s, it's a audio sync
             if args.video:
+                from .core.audiosync.audiosync import run_audiosync
                 run_audiosync(args, device, model_size, compute_type, batch_size, translation_model, console)
             # If -r / --reference is provided together with -s, it's a reference sync    
             elif args.reference:
+                from .core.referencesync.referencesync import run_referencesync
                 run_referencesync(args, device, translation_model, compute_type, console)
             # if -l / --language is provided together with -s, it's a translation 
             elif args.language:
+                from .core.translate.translate import run_translation
                 run_translation(args, device, translation_model, compute_type, console)
             # If only -s is provided, it will run unattended mode and try to auto-match the video file
             else:
+                from .core.audiosync.audiosync import run_audiosync
                 run_audiosync(args, device, model_size, compute_type, batch_size, translation_model, console)
         elif args.download:
+            from .core.download.download import run_download
             run_download(args, config, console)        
         elif args.video:
             # If only -v / --video is provided, it will run transcription in unattended mode
+            from .core.transcribe.transcribe import run_transcription
             run_transcription(args, device, model_size, compute_type, console)
 
         else:
             # Interactive mode
-            mode = select_run_mode()
             if (mode == "audio"):
+                from .core.audiosync.audiosync import run_audiosync
                 run_audiosync(args, device, model_size, compute_type, batch_size, translation_model, console)
             elif (mode == "reference"):
+                from .core.referencesync.referencesync import run_referencesync
                 run_referencesync(args, device, translation_model, compute_type, console)
             elif (mode == "point"):
+                from .core.pointsync.pointsync import run_pointsync
                 point_mode = select_pointsync_mode()
                 run_pointsync(args, point_mode, device, translation_model, console)
             elif (mode == "translate"):
+                from .core.translate.translate import run_translation
                 run_translation(args, device, translation_model, compute_type, console)
             elif (mode == "transcribe"):
+                from .core.transcribe.transcribe import run_transcription
                 run_transcription(args, device, model_size, compute_type, console)
             elif (mode == "container"):
+                from .core.container.container import run_container_tasks
                 container_mode = select_container_mode()
                 run_container_tasks(args, container_mode, console)
             elif (mode == "burn"):
+                from .core.burn.burn import run_burn
                 run_burn(args, device, console)
             elif (mode == "clean_fix"):
+                from .core.clean.clean import run_clean_fix
                 run_clean_fix(args, console)
             elif mode == "convert":
-                run_convert(args, device, console)
+                from .core.convert.convert import run_convert
+                run_convert(args, console)
             elif mode == "download":
+                from .core.download.download import run_download
                 run_download(args, config, console)
 
     except KeyboardInterrupt:
@@ -101,4 +116,4 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
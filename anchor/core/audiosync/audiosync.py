@@ -1,19 +1,58 @@
 import sys
 import time
-import gc
+from concurrent.futures import ThreadPoolExecutor
 import torch
 import pysubs2
 from pathlib import Path
 from rich.progress import Progress, SpinnerColumn, TextColumn, TimeElapsedColumn, BarColumn, TaskProgressColumn
-from ...utils.files import get_files, find_best_video_match, select_video_fallback, open_subtitle, select_files_interactive, backup_if_needed
+from ...utils.files import VIDEO_EXTENSIONS, get_files, build_video_index, find_best_video_match, select_video_fallback, open_subtitle, select_files_interactive, backup_if_needed
 from ...utils.mappings import get_language_code_for_nllb
 from ...utils.languages import get_audio_language, get_subtitle_language
 from ...utils.whisper import run_whisper_transcription, run_anchor_align_and_sync, load_whisper_model
+from ...utils.alignment import copy_timestamps
 from ..translation import translate_subtitle_nllb
 
 # Constants
 SUPPORTED_EXTENSIONS = {".srt", ".ass", ".vtt", ".sub"}
 
+def _translate_to_ghost(sub, original_sub_object, sub_lang, target_lang, device, translation_model, compute_type, console):
+    """
+    Translates the subtitle into the audio language and saves it as a temporary
+    "ghost" file to sync against. Returns the ghost file path.
+    """
+    nllb_source = get_language_code_for_nllb(sub_lang)
+    nllb_target = get_language_code_for_nllb(target_lang)
+
+    with Progress(
+        SpinnerColumn("dots"),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True
+    ) as progress:
+        task = progress.add_task("Translating", total=None)
+
+        ghost_sub = translate_subtitle_nllb(
+            original_sub_object,
+            nllb_source,
+            nllb_target,
+            device=device,
+            model_id=translation_model,
+            compute_type=compute_type,
+            progress=progress,
+            task_id=task
+        )
+
+    console.print(f"[dim]🔄 Translation complete ({sub_lang.upper()} -> {target_lang.upper()}).[/dim]")
+
+    # Save Ghost to a TEMP FILE
+    ghost_file_path = sub.with_suffix(f".tmp.{target_lang}.srt")
+    ghost_sub.save(str(ghost_file_path))
+    console.print(f"[dim]👻 Created temporary sync target: {ghost_file_path.name}[/dim]")
+    return ghost_file_path
+
 def run_audiosync(args, device, model_size, compute_type, batch_size, translation_model, console):
     """
     Main workflow for the Audio-based Sync (Whisper).
@@ -70,14 +109,16 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
             console.print("[yellow]No files selected. Returning to menu.[/yellow]")
             return
 
-        # Match Videos
+        # Match Videos (scan the folder once for the whole selection)
+        videos = get_files(VIDEO_EXTENSIONS)
+        video_index = build_video_index(videos)
         for sub_file in selected_subs:
             # Try Auto-Match
-            video_file = find_best_video_match(sub_file)
+            video_file = find_best_video_match(sub_file, video_index)
             
             # Fallback to Manual Selection (TUI)
             if not video_file:
-                video_file = select_video_fallback(sub_file.name)
+                video_file = select_video_fallback(sub_file.name, videos=videos)
             
             if video_file:
                 queue.append((sub_file, video_file))
@@ -97,15 +138,28 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
     
     current_model = None
     loaded_lang_code = "UNSET"
+    # Phoneme-alignment model per detected language, reused across the batch
+    align_cache = {}
     
     failed_count = 0
 
-    for i, (sub, vid) in enumerate(queue, 1):
+    # Probe audio languages up front and group the queue by language,
+    # so each Whisper model is loaded at most once per batch.
+    # Each probe is an ffprobe subprocess, so run them side by side.
+    unique_videos = list(dict.fromkeys(vid for _, vid in queue))
+    with ThreadPoolExecutor(max_workers=min(8, len(unique_videos))) as pool:
+        audio_langs = dict(zip(unique_videos, pool.map(get_audio_language, unique_videos)))
+    queue = [(sub, vid, audio_langs[vid]) for sub, vid in queue]
+    queue.sort(key=lambda item: item[2] or "")
+
+    # English-only variants exist for the smaller models
+    en_target_model = f"{model_size}.en" if model_size in {"tiny", "base", "small", "medium"} else model_size
+
+    for i, (sub, vid, meta_lang) in enumerate(queue, 1):
         console.print(f"\n[bold reverse] Task {i}/{len(queue)} [/bold reverse] [cyan]{sub.name}[/cyan]")
         console.print(f"🎬 Video: [yellow]{vid.name}[/yellow]")
         
         # Detection
-        meta_lang = get_audio_language(vid) 
         if meta_lang:
             console.print(f"[dim]🌐 Metadata language detected: [bold cyan]{meta_lang.upper()}[/bold cyan][/dim]")
         else:
@@ -131,48 +185,13 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
             # Load the ORIGINAL content into memory now
             original_sub_object = open_subtitle(sub)
             
-            nllb_source = get_language_code_for_nllb(sub_lang)
-            nllb_target = get_language_code_for_nllb(meta_lang)
-            
-            status_msg = f"[bold dim] Translating subtitles from [cyan]{sub_lang.upper()}[/cyan] to [cyan]{meta_lang.upper()}[/cyan] using NLLB...[/]"
-            
-            with Progress(
-                SpinnerColumn("dots"),
-                TextColumn("[progress.description]{task.description}"),
-                BarColumn(),      
-                TaskProgressColumn(),
-                TimeElapsedColumn(),
-                console=console,
-                transient=True        
-            ) as progress:
-                task = progress.add_task("Translating", total=None)
-                
-                ghost_sub = translate_subtitle_nllb(
-                    original_sub_object,
-                    nllb_source,
-                    nllb_target,
-                    device=device,
-                    model_id=translation_model,
-                    compute_type=compute_type,
-                    progress=progress,
-                    task_id=task
-                )
-
-            console.print(f"[dim]🔄 Translation complete ({sub_lang.upper()} -> {meta_lang.upper()}).[/dim]")
-
-            # Save Ghost to a TEMP FILE
-            ghost_file_path = sub.with_suffix(f".tmp.{meta_lang}.srt")
-            ghost_sub.save(str(ghost_file_path))
-            
+            ghost_file_path = _translate_to_ghost(sub, original_sub_object, sub_lang, meta_lang, device, translation_model, compute_type, console)
+
             # Point the sync engine to the translated temp file
             sub_input_for_sync = ghost_file_path
-            console.print(f"[dim]👻 Created temporary sync target: {ghost_file_path.name}[/dim]")
 
         # Determine Target Model
-        target_model = model_size
-        if meta_lang and meta_lang.lower() == "en":
-            if target_model in {"tiny", "base", "small", "medium"}:
-                target_model = f"{target_model}.en"
+        target_model = en_target_model if meta_lang and meta_lang.lower() == "en" else model_size
 
         console.print(f"[dim]🎯 Target Model: [bold white]{target_model}[/bold white][/dim]")
 
@@ -180,8 +199,8 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
         if current_model is None or loaded_lang_code != meta_lang or needs_translation:
             if current_model is not None:
                 console.print(f"[dim]🌐 Language changed ({loaded_lang_code} -> {meta_lang}). Switching model...[/dim]")
-                del current_model
-                gc.collect()
+                # Dropping the last reference frees the model; no full gc sweep needed
+                current_model = None
                 if device == "cuda": torch.cuda.empty_cache()
 
             current_model = load_whisper_model(device, compute_type, meta_lang, target_model)
@@ -192,7 +211,7 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
         start_time = time.time()
         try:
             # Step 1: Transcribe
-            whisper_data, detected_lang = run_whisper_transcription(vid, device, compute_type, batch_size, current_model, meta_lang)
+            whisper_data, detected_lang = run_whisper_transcription(vid, device, compute_type, batch_size, current_model, meta_lang, align_cache, align_words=not getattr(args, "no_word_align", False))
 
             if whisper_data is None:
                 failed_count += 1
@@ -206,39 +225,8 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
                     needs_translation = True
                     original_sub_object = open_subtitle(sub)
 
-                    nllb_source = get_language_code_for_nllb(sub_lang)
-                    nllb_target = get_language_code_for_nllb(detected_lang)
-
-                    status_msg = f"[bold dim] Translating subtitles from [cyan]{sub_lang.upper()}[/cyan] to [cyan]{detected_lang.upper()}[/cyan] using NLLB...[/]"
-
-                    with Progress(
-                        SpinnerColumn("dots"),
-                        TextColumn("[progress.description]{task.description}"),
-                        BarColumn(),
-                        TaskProgressColumn(),
-                        TimeElapsedColumn(),
-                        console=console,
-                        transient=True
-                    ) as progress:
-                        task = progress.add_task("Translating", total=None)
-
-                        ghost_sub = translate_subtitle_nllb(
-                            original_sub_object,
-                            nllb_source,
-                            nllb_target,
-                            device=device,
-                            model_id=translation_model,
-                            compute_type=compute_type,
-                            progress=progress,
-                            task_id=task
-                        )
-
-                    console.print(f"[dim]🔄 Translation complete ({sub_lang.upper()} -> {detected_lang.upper()}).[/dim]")
-
-                    ghost_file_path = sub.with_suffix(f".tmp.{detected_lang}.srt")
-                    ghost_sub.save(str(ghost_file_path))
+                    ghost_file_path = _translate_to_ghost(sub, original_sub_object, sub_lang, detected_lang, device, translation_model, compute_type, console)
                     sub_input_for_sync = ghost_file_path
-                    console.print(f"[dim]👻 Created temporary sync target: {ghost_file_path.name}[/dim]")
 
             # Step 3: Align & Sync
             out_path, lines, rejected = run_anchor_align_and_sync(sub_input_for_sync, whisper_data, args)
@@ -251,9 +239,7 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
 
                 synced_ghost = pysubs2.load(str(out_path))
 
-                for orig_event, ghost_event in zip(original_sub_object, synced_ghost):
-                    orig_event.start = ghost_event.start
-                    orig_event.end = ghost_event.end
+                copy_timestamps(original_sub_object, synced_ghost)
 
                 if args and getattr(args, "overwrite", False):
                     backup_if_needed(sub, args)
@@ -289,6 +275,7 @@ def run_audiosync(args, device, model_size, compute_type, batch_size, translatio
     # Cleanup at very end
     if current_model:
         del current_model
+    align_cache.clear()
     
     total_duration = time.time() - total_start
     
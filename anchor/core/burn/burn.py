@@ -1,22 +1,130 @@
+import os
 import subprocess
-import threading
-import queue
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeElapsedColumn
 
-from ...utils.files import get_files, find_best_video_match, select_video_fallback, select_files_interactive
+from ...utils.files import VIDEO_EXTENSIONS, get_files, build_video_index, find_best_video_match, select_video_fallback, select_files_interactive
 from ...utils.video import get_video_info
 
 
-def _build_output_name(video_path: Path, suffix=".burn"):
+def _build_output_name(video_path: Path, suffix=".burn", taken=()):
     base = video_path.stem
     out = video_path.with_name(f"{base}{suffix}{video_path.suffix}")
     counter = 1
-    while out.exists():
+    while out.exists() or out in taken:
         out = video_path.with_name(f"{base}{suffix}_{counter}{video_path.suffix}")
         counter += 1
     return out
 
 
+def _burn_workers(device, job_count):
+    """
+    How many ffmpeg jobs to run side by side. Hardware encoders get a small
+    fixed pool (consumer NVENC caps concurrent sessions); software encoders
+    split the CPU cores between jobs.
+    Returns (workers, ffmpeg threads per job or None).
+    """
+    if device in ("cuda", "xpu"):
+        return min(2, job_count), None
+    cores = os.cpu_count() or 1
+    workers = max(1, min(job_count, cores // 4))
+    return workers, max(1, cores // workers)
+
+
+def _burn_one(sub, vid, out_file, device, console, progress, threads=None):
+    """Burns one subtitle file into one video with ffmpeg."""
+    console.print(f"\n🔥 Burning: [cyan]{sub.name}[/cyan] into [yellow]{vid.name}[/yellow]")
+
+    # --- METADATA EXTRACTION ---
+    console.print(" 🔍 Analyzing original video codec and quality...")
+    orig_codec, orig_bitrate, duration = get_video_info(vid)
+    
+    # --- PATH ESCAPING FOR FFMPEG FILTER ---
+    # FFmpeg's subtitles filter is very strict. Replace \ with / and escape colons/quotes.
+    sub_escaped = str(sub.absolute()).replace('\\', '/').replace(':', '\\:').replace("'", "'\\''")
+    subtitles_filter = f"subtitles='{sub_escaped}'"
+    vf = subtitles_filter
+
+    # --- CODEC & DEVICE MAPPING ---
+    vcodec = "libx264"
+    encoder_args = []
+    decoder_args = []
+
+    if device == "cuda":
+        if orig_codec == "hevc": vcodec = "hevc_nvenc"
+        elif orig_codec == "av1": vcodec = "av1_nvenc"
+        else: vcodec = "h264_nvenc"
+        encoder_args = ["-preset", "p4"]
+        # Decode on NVDEC too; frames land in system memory in their native
+        # pixel format, which the (CPU-only) subtitles filter needs anyway
+        decoder_args = ["-hwaccel", "cuda"]
+
+    elif device == "xpu":
+        if orig_codec == "hevc": vcodec = "hevc_qsv"
+        elif orig_codec == "av1": vcodec = "av1_qsv"
+        else: vcodec = "h264_qsv"
+        vf = f"{subtitles_filter},format=nv12,hwupload"
+        encoder_args = ["-preset", "medium"]
+
+    else: # CPU Fallback
+        if orig_codec == "hevc": vcodec = "libx265"
+        elif orig_codec == "vp9": vcodec = "libvpx-vp9"
+        else: vcodec = "libx264"
+        encoder_args = ["-preset", "medium"]
+
+    # --- QUALITY / BITRATE TARGETING ---
+    encoder_args = ["-c:v", vcodec] + encoder_args
+    
+    if orig_bitrate:
+        console.print(f" 🎯 Matching original format: [bold]{orig_codec.upper()}[/bold] at [bold]{int(orig_bitrate)//1000} kbps[/bold]")
+        # Use standard ABR targeting to match file size
+        encoder_args.extend([
+            "-b:v", str(orig_bitrate), 
+            "-maxrate", str(int(orig_bitrate) * 1.5), 
+            "-bufsize", str(int(orig_bitrate) * 2)
+        ])
+    else:
+        console.print(f" 🎯 Matching original format: [bold]{orig_codec.upper()}[/bold] [dim](Using High-Quality Fallback)[/dim]")
+        # Fallback if bitrate is missing: High Quality Constant Rate
+        if "nvenc" in vcodec: encoder_args.extend(["-cq", "22", "-rc", "vbr"])
+        elif "qsv" in vcodec: encoder_args.extend(["-global_quality", "22"])
+        else: encoder_args.extend(["-crf", "22"])
+
+    cmd = [
+        "ffmpeg", "-hide_banner", "-y", "-v", "error",
+        "-progress", "pipe:1", "-nostats",
+        *decoder_args,
+        "-i", str(vid),
+        "-vf", vf,
+        *encoder_args,
+        *(["-threads", str(threads)] if threads else []),
+        "-c:a", "copy",
+        str(out_file)
+    ]
+
+    task_id = progress.add_task(f"Burning {vid.name}", total=duration)
+    try:
+        # ffmpeg reports key=value progress blocks on stdout; errors still go to stderr
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, text=True)
+        for line in proc.stdout:
+            key, _, value = line.strip().partition("=")
+            if key == "out_time_us":
+                try:
+                    progress.update(task_id, completed=int(value) / 1_000_000)
+                except ValueError:
+                    pass  # "N/A" before the first frame is written
+        if proc.wait() != 0:
+            raise subprocess.CalledProcessError(proc.returncode, cmd)
+        console.print(f" [bold green]✅ Burn complete:[/bold green] {out_file.name}")
+    except subprocess.CalledProcessError as e:
+        console.print(f" [bold red]❌ ffmpeg failed for {vid.name}:[/bold red] Ensure the codec is supported by your hardware.")
+    except Exception as e:
+        console.print(f" [bold red]❌ Unexpected error:[/bold red] {e}")
+    finally:
+        progress.remove_task(task_id)
+
+
 def run_burn(args, device, console):
     """Batch burn-in subtitles onto video files."""
 
@@ -33,11 +141,13 @@ def run_burn(args, device, console):
 
     # Build work items (sub, video)
     work_items = []
+    videos = get_files(VIDEO_EXTENSIONS)
+    video_index = build_video_index(videos)
     for sub in selected:
-        vid = find_best_video_match(sub)
+        vid = find_best_video_match(sub, video_index)
         if not vid:
             console.print(f"[dim]No auto-match for [cyan]{sub.name}[/cyan]. Asking for video...[/dim]")
-            vid = select_video_fallback(sub.name)
+            vid = select_video_fallback(sub.name, videos=videos)
 
         if vid:
             work_items.append((sub, vid))
@@ -50,91 +160,28 @@ def run_burn(args, device, console):
 
     console.print(f"\n[bold green]🚀 Starting Burn-in ({len(work_items)} items)...[/bold green]")
 
-    q = queue.Queue()
-    for item in work_items:
-        q.put(item)
-
-    def _worker():
-        while not q.empty():
-            sub, vid = q.get()
-            console.print(f"\n🔥 Burning: [cyan]{sub.name}[/cyan] into [yellow]{vid.name}[/yellow]")
-            out_file = _build_output_name(vid)
-
-            # --- METADATA EXTRACTION ---
-            console.print(" 🔍 Analyzing original video codec and quality...")
-            orig_codec, orig_bitrate = get_video_info(vid)
-            
-            # --- PATH ESCAPING FOR FFMPEG FILTER ---
-            # FFmpeg's subtitles filter is very strict. Replace \ with / and escape colons/quotes.
-            sub_escaped = str(sub.absolute()).replace('\\', '/').replace(':', '\\:').replace("'", "'\\''")
-            subtitles_filter = f"subtitles='{sub_escaped}'"
-            vf = subtitles_filter
-
-            # --- CODEC & DEVICE MAPPING ---
-            vcodec = "libx264"
-            encoder_args = []
-
-            if device == "cuda":
-                if orig_codec == "hevc": vcodec = "hevc_nvenc"
-                elif orig_codec == "av1": vcodec = "av1_nvenc"
-                else: vcodec = "h264_nvenc"
-                encoder_args = ["-preset", "p4"]
-
-            elif device == "xpu":
-                if orig_codec == "hevc": vcodec = "hevc_qsv"
-                elif orig_codec == "av1": vcodec = "av1_qsv"
-                else: vcodec = "h264_qsv"
-                vf = f"{subtitles_filter},format=nv12,hwupload"
-                encoder_args = ["-preset", "medium"]
-
-            else: # CPU Fallback
-                if orig_codec == "hevc": vcodec = "libx265"
-                elif orig_codec == "vp9": vcodec = "libvpx-vp9"
-                else: vcodec = "libx264"
-                encoder_args = ["-preset", "medium"]
-
-            # --- QUALITY / BITRATE TARGETING ---
-            encoder_args = ["-c:v", vcodec] + encoder_args
-            
-            if orig_bitrate:
-                console.print(f" 🎯 Matching original format: [bold]{orig_codec.upper()}[/bold] at [bold]{int(orig_bitrate)//1000} kbps[/bold]")
-                # Use standard ABR targeting to match file size
-                encoder_args.extend([
-                    "-b:v", str(orig_bitrate), 
-                    "-maxrate", str(int(orig_bitrate) * 1.5), 
-                    "-bufsize", str(int(orig_bitrate) * 2)
-                ])
-            else:
-                console.print(f" 🎯 Matching original format: [bold]{orig_codec.upper()}[/bold] [dim](Using High-Quality Fallback)[/dim]")
-                # Fallback if bitrate is missing: High Quality Constant Rate
-                if "nvenc" in vcodec: encoder_args.extend(["-cq", "22", "-rc", "vbr"])
-                elif "qsv" in vcodec: encoder_args.extend(["-global_quality", "22"])
-                else: encoder_args.extend(["-crf", "22"])
-
-            cmd = [
-                "ffmpeg", "-hide_banner", "-y", "-v", "error",
-                "-i", str(vid),
-                "-vf", vf,
-                *encoder_args,
-                "-c:a", "copy",
-                str(out_file)
-            ]
-
-            try:
-                # Using rich status spinner because encoding takes time!
-                with console.status("🎬 Burning subtitles into video stream...", spinner="dots"):
-                    subprocess.run(cmd, check=True)
-                console.print(f" [bold green]✅ Burn complete:[/bold green] {out_file.name}")
-            except subprocess.CalledProcessError as e:
-                console.print(f" [bold red]❌ ffmpeg failed for {vid.name}:[/bold red] Ensure the codec is supported by your hardware.")
-            except Exception as e:
-                console.print(f" [bold red]❌ Unexpected error:[/bold red] {e}")
-
-            q.task_done()
-
-    # Single-threaded worker preserves simplicity and avoids ffmpeg contention
-    t = threading.Thread(target=_worker)
-    t.start()
-    t.join()
+    # Reserve output names up front so parallel jobs never pick the same file
+    jobs = []
+    taken = set()
+    for sub, vid in work_items:
+        out_file = _build_output_name(vid, taken=taken)
+        taken.add(out_file)
+        jobs.append((sub, vid, out_file))
+
+    workers, threads = _burn_workers(device, len(jobs))
+
+    # One progress bar per running encode, driven by ffmpeg's -progress output
+    with Progress(
+        SpinnerColumn("dots"),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(),
+        TaskProgressColumn(),
+        TimeElapsedColumn(),
+        console=console,
+        transient=True
+    ) as progress:
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            for sub, vid, out_file in jobs:
+                pool.submit(_burn_one, sub, vid, out_file, device, console, progress, threads)
 
     console.print(f"\n[bold green]✨ Burn-in batch complete.[/bold green]")
\ No newline at end of file
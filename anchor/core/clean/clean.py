@@ -1,7 +1,64 @@
+import os
+from concurrent.futures import ProcessPoolExecutor
+
 from ...utils.files import get_files, select_files_interactive, _run_curses_picker
 from ...utils.files import open_subtitle, backup_if_needed
 from .operations import remove_sdh, strip_tags, remove_empty_cues, fix_overlaps, remove_watermarks, fix_capitalization
 
+# Operation ID -> (log line, function)
+OP_TABLE = {
+    "sdh": (" 🧹 Removing SDH...", remove_sdh),
+    "tags": (" 🏷️ Stripping tags...", strip_tags),
+    "empty": (" 👻 Removing empty cues...", remove_empty_cues),
+    "overlaps": (" ⏱️ Fixing overlaps...", fix_overlaps),
+    "watermarks": (" 🕵️ Hunting watermarks...", remove_watermarks),
+    "caps": (" 🔠 Fixing capitalization...", fix_capitalization),
+}
+
+def _build_pipeline(selected_operations):
+    """Resolves the selected operation IDs to their (log line, function) steps once."""
+    return [OP_TABLE[op] for op in selected_operations if op in OP_TABLE]
+
+def _print_task(console, task_idx, total_files, sub_path, lines):
+    console.print(f"\n[black on white] Task {task_idx}/{total_files} [/black on white] [bold cyan]{sub_path.name}[/bold cyan]")
+    for line in lines:
+        console.print(line)
+
+def _clean_one(job):
+    """
+    Loads, cleans and saves one subtitle file. Runs in a worker process.
+    Returns the rich-formatted log lines for the caller to print.
+    """
+    sub_path, pipeline, args = job
+    lines = []
+    
+    # Load the subtitle file into memory
+    try:
+        edit_subs = open_subtitle(sub_path, keep_html_tags=True, keep_unknown_html_tags=True)
+    except Exception as e:
+        lines.append(f" ❌ [bold red]Failed to load subtitle:[/bold red] {e}")
+        return lines
+
+    # Chain the operations together on the 'edit_subs' object
+    for label, func in pipeline:
+        lines.append(label)
+        edit_subs = func(edit_subs)
+
+    # Determine output path
+    overwrite = getattr(args, 'overwrite', False)
+    
+    if overwrite:
+        backup_if_needed(sub_path, args)
+        output_path = sub_path
+    else:
+        output_path = sub_path.with_name(f"{sub_path.stem}.cleaned{sub_path.suffix}")
+        
+    # Save the cleaned subtitle back to disk
+    edit_subs.save(str(output_path))
+    
+    lines.append(f" 💾 Saved to: [u]{output_path.name}[/u]")
+    return lines
+
 def run_clean_fix(args, console):
     console.print("\n[bold cyan]✂️  Running Clean & Fix Task[/bold cyan]\n")
 
@@ -55,54 +112,20 @@ def run_clean_fix(args, console):
     console.print(f"\n[bold green]🚀 Starting Cleanup ({total_files} file{'s' if total_files > 1 else ''}, {total_ops} operation{'s' if total_ops > 1 else ''})...[/bold green]")
 
     # Processing Loop
-    for task_idx, sub_path in enumerate(selected_files, 1):
-        console.print(f"\n[black on white] Task {task_idx}/{total_files} [/black on white] [bold cyan]{sub_path.name}[/bold cyan]")
-        
-        # Load the subtitle file into memory
-        try:
-            edit_subs = open_subtitle(sub_path, keep_html_tags=True, keep_unknown_html_tags=True)
-        except Exception as e:
-            console.print(f" ❌ [bold red]Failed to load subtitle:[/bold red] {e}")
-            continue
-
-        # Chain the operations together on the 'edit_subs' object
-        for op in selected_operations:
-            if op == "sdh":
-                console.print(" 🧹 Removing SDH...")
-                edit_subs = remove_sdh(edit_subs)
-                
-            elif op == "tags":
-                console.print(" 🏷️ Stripping tags...")
-                edit_subs = strip_tags(edit_subs)
-                
-            elif op == "empty":
-                console.print(" 👻 Removing empty cues...")
-                edit_subs = remove_empty_cues(edit_subs)
-                
-            elif op == "overlaps":
-                console.print(" ⏱️ Fixing overlaps...")
-                edit_subs = fix_overlaps(edit_subs)
-                
-            elif op == "watermarks":
-                console.print(" 🕵️ Hunting watermarks...")
-                edit_subs = remove_watermarks(edit_subs)
-                
-            elif op == "caps":
-                console.print(" 🔠 Fixing capitalization...")
-                edit_subs = fix_capitalization(edit_subs)
-
-        # Determine output path
-        overwrite = getattr(args, 'overwrite', False)
-        
-        if overwrite:
-            backup_if_needed(sub_path, args)
-            output_path = sub_path
-        else:
-            output_path = sub_path.with_name(f"{sub_path.stem}.cleaned{sub_path.suffix}")
-            
-        # Save the cleaned subtitle back to disk
-        edit_subs.save(str(output_path))
-        
-        console.print(f" 💾 Saved to: [u]{output_path.name}[/u]")
+    # Files are independent CPU-bound regex work, so spread them over worker processes.
+    # Workers hand back their log lines, which are printed here in selection order.
+    workers = min(total_files, os.cpu_count() or 1)
+    # Resolve the selected operations once for the whole batch
+    pipeline = _build_pipeline(selected_operations)
+    jobs = [(sub_path, pipeline, args) for sub_path in selected_files]
+    
+    if workers > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = pool.map(_clean_one, jobs)
+            for task_idx, (sub_path, lines) in enumerate(zip(selected_files, results), 1):
+                _print_task(console, task_idx, total_files, sub_path, lines)
+    else:
+        for task_idx, job in enumerate(jobs, 1):
+            _print_task(console, task_idx, total_files, job[0], _clean_one(job))
 
     console.print("\n[bold green]🧽 Clean & Fix Complete![/bold green]")
\ No newline at end of file
@@ -1,66 +1,222 @@
 import re
+from itertools import compress
+from operator import attrgetter
 
-def remove_sdh(sub):
+try:
+    from itertools import pairwise
+except ImportError:
+    # Python 3.9
+    def pairwise(iterable):
+        items = list(iterable)
+        return zip(items, items[1:])
+
+# Optional RE2 (google-re2): a linear-time DFA engine, faster than `re` on the
+# large batched strings below. Falls back to `re` when not installed.
+try:
+    import re2 as _re_batch
+except ImportError:
+    _re_batch = re
+
+# --- PRECOMPILED PATTERNS ---
+# Compiled once at import; these run inside per-cue / per-line loops.
+
+# HTML tags <...> and ASS override tags {\...}
+_TAG_RE = re.compile(r'<[^>]+>|\{\\[^}]+\}')
+# Same, but never matching across the separator used to batch many cues into one string
+_CUE_SEP = '\x00'
+_TAG_NOSEP_RE = _re_batch.compile(r'<[^>\x00]+>|\{\\[^}\x00]+\}')
+# Same, with a capture group so re.split keeps the tags
+_TAG_SPLIT_RE = re.compile(r'(<[^>]+>|\{\\[^}]+\})')
+# pysubs2 (\N) and plain (\n) line breaks
+_SPLIT_NL_RE = re.compile(r'\\N|\n')
+# A run of line breaks plus the whitespace around them (i.e. blank lines and line padding)
+_LINE_BREAKS_RE = re.compile(r'(?:\s*(?:\\N|\n))+\s*')
+_HAS_UPPER_RE = re.compile(r'[A-Z]')
+_HAS_ALNUM_RE = re.compile(r'[a-zA-Z0-9]')
+
+# SDH
+_BRACKET_RE = re.compile(r'\[.*?\]|\(.*?\)|\{(?!\\).*?\}|\?.*?\?')
+_MUSIC_SYMBOLS = ['♪', '♫', '♩', '♬', '♭', '♮', '♯', '𝄞', '𝄢', '#']
+_MUSIC_CLASS = f"[{''.join(_MUSIC_SYMBOLS)}]"
+_MUSIC_PAIR_RE = re.compile(f"(?s){_MUSIC_CLASS}.*?{_MUSIC_CLASS}")
+# Per-line SDH pass, one scan: a leading speaker label (keeping any tags before
+# it) or an unclosed music symbol with its trailing lyrics
+_SDH_LINE_RE = re.compile(
+    r'(?P<speaker>^(?P<lead>(?:<[^>]+>|\{\\[^}]+\})*)\s*[A-Z0-9\s\.\-]+:\s*)'
+    f"|{_MUSIC_CLASS}.*?(?= - |$)"
+)
+
+def _sdh_line_sub(m):
+    return m.group('lead') if m.group('speaker') is not None else ''
+
+# Literal prefilters: most dialogue cues contain none of these characters, and a
+# C-level set/substring check is far cheaper than starting the regex engine
+_MUSIC_CHARS = frozenset(_MUSIC_SYMBOLS)
+_SDH_CUE_TRIGGERS = frozenset('[({?') | _MUSIC_CHARS
+
+# Sort key for cues, matching SSAEvent's (start, end) ordering
+_EVENT_TIMES = attrgetter('start', 'end')
+
+# Leftovers that don't count as visible text
+_TRIVIAL_TEXT = frozenset({'.', ',', '?', '-', '..'})
+
+def _strip_tag_text(text):
+    """Removes HTML/ASS tags, skipping the regex when the text can't contain any."""
+    if '<' in text or '{' in text:
+        return _TAG_RE.sub('', text)
+    return text
+
+def _is_all_caps(text):
     """
-    Removes SDH elements based on heuristics.
+    True if the text has cased letters, all uppercase, including at least one A-Z.
+    For ASCII text isupper() already implies an A-Z letter, so the regex only runs otherwise.
+    """
+    return text.isupper() and (text.isascii() or _HAS_UPPER_RE.search(text) is not None)
+
+def _strip_tags_batch(texts):
+    """
+    Removes tags from many texts with one regex call over a separator-joined string.
+    Falls back to per-text stripping if a text itself contains the separator.
+    """
+    bare = _TAG_NOSEP_RE.sub('', _CUE_SEP.join(texts)).split(_CUE_SEP)
+    if len(bare) != len(texts):
+        return [_strip_tag_text(text) for text in texts]
+    return bare
+
+# Watermarks
+# Hard Promo: Characters practically never say these.
+_HARD_VERB_RE = re.compile(r'(?i)(?:sync(?:ed)?|sub(?:title)?s?|subbed|encod(?:ed)?)\s+(?:by|from)')
+# Soft Promo: Could technically be dialogue ("It was translated by the UN.")
+_SOFT_VERB_RE = re.compile(r'(?i)(?:download(?:ed)?|correct(?:ed)?|translat(?:ed)?)\s+(?:by|from)')
+# URLs and Domains
+_URL_RE = re.compile(r'(?i)(?:www\.|https?://|\.com|\.org|\.net|\.tv|\.ro|\.co)')
+# Known Subtitle keywords
+_URL_KW_RE = re.compile(r'(?i)(?:sub|sync|addic7ed|yts|ganool|opensub|podnapisi|tvsubtitles|subscene|titlovi)')
+# Scene Release Metadata
+_METADATA_RE = re.compile(r'(?i)(?:s\d{2}e\d{2}|1080p|720p|480p|x264|x265|bluray|web-?rip|hdtv|web-?dl|rip)')
+# Decorative ASCII: lines starting and ending with non-alphanumeric chars
+_DECO_RE = re.compile(r'^[^a-zA-Z0-9]+.*[^a-zA-Z0-9]+$')
+_ASCII_ALNUM = frozenset('abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789')
+
+def _is_decorative(text):
+    """Same as _DECO_RE plus the length check, with plain char tests for single-line text."""
+    if len(text) <= 4:
+        return False
+    if '\n' in text:
+        # '.' doesn't cross newlines, so let the regex decide
+        return _DECO_RE.search(text) is not None
+    return text[0] not in _ASCII_ALNUM and text[-1] not in _ASCII_ALNUM
+# Any pattern that can lift a cue to the threshold (boundary 50 + deco 20 alone can't,
+# and a keyword only counts next to a URL), so one search rules out clean cues
+_WM_TRIGGER_RE = re.compile(r'(?i)' + '|'.join(
+    p.pattern.removeprefix('(?i)') for p in (_HARD_VERB_RE, _SOFT_VERB_RE, _URL_RE, _METADATA_RE)
+))
+# Middle cues get no boundary bonus, so metadata (60) + deco (20) can't get there either
+_WM_MIDDLE_TRIGGER_RE = re.compile(r'(?i)' + '|'.join(
+    p.pattern.removeprefix('(?i)') for p in (_HARD_VERB_RE, _SOFT_VERB_RE, _URL_RE)
+))
+
+# Sentence case over lowercased text: the first letter after . ! ? (skipping anything
+# that isn't a letter), plus the English "I" pronoun (i, i'm, i'll, i've, i'd).
+# \b ensures we don't accidentally capitalize the 'i' in 'alien'.
+_SENTENCE_END_RE = re.compile(r"[.!?]")
+# Letter candidates: word chars minus digits and '_'. \w still admits some non-letters
+# (①, ⅳ, ², ½, ...), so every hit is confirmed with str.isalpha before it's capitalized
+_LETTER_CANDIDATE_RE = re.compile(r"[^\W\d_]")
+_PRONOUN_I_RE = re.compile(r"\b(i)(['’]?(?:m|ll|ve|d)?)\b")
+
+def _next_letter(text, pos):
+    """Finds the first str.isalpha() character at or after pos."""
+    m = _LETTER_CANDIDATE_RE.search(text, pos)
+    while m and not m.group().isalpha():
+        m = _LETTER_CANDIDATE_RE.search(text, m.end())
+    return m
+
+def _sentence_case(text, capitalize_next):
     """
-    bracket_pattern = re.compile(r'\[.*?\]|\(.*?\)|\{(?!\\).*?\}|\?.*?\?')
-    speaker_pattern = re.compile(r'^((?:<[^>]+>|\{\\[^}]+\})*)\s*[A-Z0-9\s\.\-]+:\s*')
-    tag_pattern = re.compile(r'<[^>]+>|\{\\[^}]+\}')
+    Lowercases a text chunk and capitalizes sentence starts.
+    Returns (text, capitalize_next) so the state carries across tag boundaries.
+    """
+    text = text.lower()
+    pieces = []
+    last = pos = 0
     
-    # --- MUSIC PATTERN SETUP ---
-    music_symbols = ['♪', '♫', '♩', '♬', '♭', '♮', '♯', '𝄞', '𝄢', '#']
-    music_class = f"[{''.join(music_symbols)}]"
-    music_pair_pattern = re.compile(f"(?s){music_class}.*?{music_class}")
-    music_trailing_pattern = re.compile(f"{music_class}.*?(?= - |$)")
+    while True:
+        if not capitalize_next:
+            m = _SENTENCE_END_RE.search(text, pos)
+            if not m:
+                break
+            pos = m.end()
+        
+        # A sentence end with no letter after it carries over to the next chunk
+        m = _next_letter(text, pos)
+        if not m:
+            capitalize_next = True
+            break
+        
+        pieces.append(text[last:m.start()])
+        pieces.append(m.group().upper())
+        last = pos = m.end()
+        capitalize_next = False
+    
+    pieces.append(text[last:])
+    return _PRONOUN_I_RE.sub(lambda m: "I" + m.group(2), "".join(pieces)), capitalize_next
 
-    # --- PRE-SCAN: Protect ALL-CAPS subtitle files ---
+def remove_sdh(sub):
+    """
+    Removes SDH elements based on heuristics.
+    """
+    # Protect ALL-CAPS subtitle files: count purely uppercase cues during the
+    # main pass, and only decide at the end whether uppercase lines get dropped.
+    # One tag-strip over the whole file instead of one regex call per cue
     total_cues = len(sub)
     upper_count = 0
-    for cue in sub:
-        bare = re.sub(tag_pattern, '', cue.text).strip()
-        if bare.isupper() and re.search(r'[A-Z]', bare):
+    all_bare = _strip_tags_batch([cue.text for cue in sub])
+    
+    # (cue, text keeping uppercase lines, text without them or None if it has none)
+    pending = []
+
+    for cue, bare in zip(sub, all_bare):
+        bare = bare.strip()
+        if _is_all_caps(bare):
             upper_count += 1
             
-    # If more than 30% of the file is purely uppercase, it's not SDH.
-    # Disale the uppercase nuke to avoid destroying legitimate ALL-CAPS files
-    disable_upper_nuke = total_cues > 0 and (upper_count / total_cues) > 0.30
-
-    valid_cues = []
-
-    for cue in sub:
         original_text = cue.text
         
         # Auto-detect the newline style (pysubs2 uses \N, others use \n)
         nl = r'\N' if r'\N' in original_text else '\n'
         
-        # Strip brackets
-        cleaned_text = re.sub(bracket_pattern, '', original_text)
-        
-        # WIPE PAIRED MUSIC TAGS ACROSS MULTIPLE LINES
-        cleaned_text = re.sub(music_pair_pattern, '', cleaned_text)
+        if _SDH_CUE_TRIGGERS.isdisjoint(original_text):
+            # No brackets or music symbols anywhere in the cue
+            cleaned_text = original_text
+        else:
+            # Strip brackets
+            cleaned_text = _BRACKET_RE.sub('', original_text)
+            
+            # WIPE PAIRED MUSIC TAGS ACROSS MULTIPLE LINES
+            cleaned_text = _MUSIC_PAIR_RE.sub('', cleaned_text)
         
         # Now split the remaining text into lines
-        lines = re.split(r'\\N|\n', cleaned_text)
+        lines = _SPLIT_NL_RE.split(cleaned_text)
         cleaned_lines = []
+        upper_lines = []
         
         for line in lines:
             line = line.strip()
             
-            # Strip speaker label but keep leading tags
-            line = re.sub(speaker_pattern, r'\1', line).strip()
-
-            # WIPE OUT UNCLOSED SYMBOLS AND TRAILING LYRICS (LINE BY LINE)
-            line = re.sub(music_trailing_pattern, '', line).strip()
+            # Strip speaker label (keeping leading tags) and wipe out unclosed
+            # symbols with their trailing lyrics, line by line
+            if ':' in line or not _MUSIC_CHARS.isdisjoint(line):
+                line = _SDH_LINE_RE.sub(_sdh_line_sub, line).strip()
             
             # Check the "bare" text
-            bare_text = re.sub(tag_pattern, '', line).strip()
+            bare_text = _strip_tag_text(line).strip()
             
-            # Only drop uppercase lines if the file isn't an ALL-CAPS file
-            if not disable_upper_nuke and bare_text.isupper() and re.search(r'[A-Z]', bare_text):
-                continue
+            # Uppercase lines are kept for now and dropped later unless this is an ALL-CAPS file
+            if _is_all_caps(bare_text):
+                upper_lines.append(len(cleaned_lines))
                 
-            if bare_text.startswith('-') and not re.search(r'[a-zA-Z0-9]', bare_text):
+            elif bare_text.startswith('-') and not _HAS_ALNUM_RE.search(bare_text):
                 continue
                 
             if bare_text:
@@ -68,12 +224,28 @@ def remove_sdh(sub):
                 
         # Rejoin with the correct newline character
         final_text = nl.join(cleaned_lines).strip()
+        if upper_lines:
+            upper_lines = set(upper_lines)
+            nuked_text = nl.join(line for i, line in enumerate(cleaned_lines) if i not in upper_lines).strip()
+        else:
+            nuked_text = None
+        pending.append((cue, final_text, nuked_text))
+            
+    # If more than 30% of the file is purely uppercase, it's not SDH.
+    # Disale the uppercase nuke to avoid destroying legitimate ALL-CAPS files
+    disable_upper_nuke = total_cues > 0 and (upper_count / total_cues) > 0.30
+
+    valid_cues = []
+    
+    for cue, final_text, nuked_text in pending:
+        if nuked_text is not None and not disable_upper_nuke:
+            final_text = nuked_text
         cue.text = final_text
         
         # ONLY KEEP THE CUE IF IT STILL HAS VISIBLE TEXT
         # If removing SDH completely emptied the subtitle block or just left a single period, it gets dropped
-        bare_final = re.sub(tag_pattern, '', final_text).strip()
-        if bare_final and bare_final not in ['.', ',', '?', '-', '..']:
+        bare_final = _strip_tag_text(final_text).strip()
+        if bare_final and bare_final not in _TRIVIAL_TEXT:
             valid_cues.append(cue)
             
     # Replace the old subtitle list
@@ -84,48 +256,42 @@ def strip_tags(sub):
     """
     Strips all HTML tags (e.g., <i>, <font>) and ASS formatting tags (e.g., {\\an8}).
     """
-    # Matches HTML tags <...> and ASS tags {\...}
-    tag_pattern = re.compile(r'<[^>]+>|\{\\[^}]+\}')
+    # 1. Strip all tags from every cue in one pass
+    all_bare = _strip_tags_batch([cue.text for cue in sub])
     
-    for cue in sub:
-        # 1. Strip all tags from the text
-        cleaned_text = re.sub(tag_pattern, '', cue.text)
+    for cue, cleaned_text in zip(sub, all_bare):
+        # 2. Clean up any weird spacing left behind: strip outer spaces and
+        # collapse blank lines in one substitution, keeping the cue's newline style
+        cleaned_text = cleaned_text.strip()
+        if r'\N' in cleaned_text:
+            cleaned_text = _LINE_BREAKS_RE.sub(r'\\N', cleaned_text)
+            cleaned_text = cleaned_text.removeprefix(r'\N').removesuffix(r'\N')
+        elif '\n' in cleaned_text:
+            cleaned_text = _LINE_BREAKS_RE.sub('\n', cleaned_text)
         
-        # 2. Clean up any weird spacing left behind
-        nl = r'\N' if r'\N' in cleaned_text else '\n'
-        lines = re.split(r'\\N|\n', cleaned_text)
-        
-        # Keep lines that still have text, stripping outer spaces
-        cleaned_lines = [line.strip() for line in lines if line.strip()]
-        
-        # Rejoin with the correct newline
-        cue.text = nl.join(cleaned_lines)
+        cue.text = cleaned_text
         
     return sub
 
+def _has_visible_text(text):
+    """True if the text still shows something once tags, newlines and spaces are gone."""
+    # Strip tags in memory (only when the cue can contain any)
+    bare_text = _strip_tag_text(text)
+    
+    # Strip literal pysubs2 newlines (\N), standard newlines (\n), and all spaces
+    # (str.replace hands back the same object when there is nothing to replace)
+    bare_text = bare_text.replace(r'\N', '').replace('\n', '').strip()
+    
+    return bool(bare_text) and bare_text not in _TRIVIAL_TEXT
+
 def remove_empty_cues(sub):
     """
     Removes subtitle blocks that contain no visible text.
     Safely identifies cues that are purely whitespace, empty tags, or standalone newlines.
     """
-    # Pattern to temporarily strip HTML and ASS tags for the "empty" check
-    tag_pattern = re.compile(r'<[^>]+>|\{\\[^}]+\}')
-    
-    valid_cues = []
-    
-    for cue in sub:
-        # Strip tags in memory
-        bare_text = re.sub(tag_pattern, '', cue.text)
-        
-        # Strip literal pysubs2 newlines (\N), standard newlines (\n), and all spaces
-        bare_text = bare_text.replace(r'\N', '').replace('\n', '').strip()
-        
-        # If there is actual visible text left, keep the original cue (tags included)
-        if bare_text and bare_text not in ['.', ',', '?', '-', '..']:
-            valid_cues.append(cue)
-            
-    # Replace the subtitle object's internal list with our scrubbed list
-    sub[:] = valid_cues
+    # Keep mask first, then one C-level filter into the subtitle object's internal list
+    keep = [_has_visible_text(cue.text) for cue in sub]
+    sub[:] = list(compress(sub, keep))
     
     return sub
 
@@ -135,16 +301,14 @@ def fix_overlaps(sub):
     to match the start time of the incoming cue.
     """
     # Sort the subtitles chronologically by start time first!
-    # pysubs2 has a built-in sort() method that handles this perfectly.
-    sub.sort()
+    # Same (start, end) order as pysubs2's sort(), but with a C-level key
+    # instead of calling SSAEvent.__lt__ for every comparison.
+    sub.events.sort(key=_EVENT_TIMES)
     
     valid_cues = []
     
-    # Iterate through all cues except the very last one
-    for i in range(len(sub) - 1):
-        current_cue = sub[i]
-        next_cue = sub[i + 1]
-        
+    # Walk consecutive pairs (every cue except the very last one)
+    for current_cue, next_cue in pairwise(sub.events):
         #  Check for the overlap collision
         if current_cue.end > next_cue.start:
             # Trim the current cue to end exactly when the next one begins
@@ -172,30 +336,26 @@ def remove_watermarks(sub):
     Removes promotional watermarks, credits, and URLs using a weighted confidence score.
     A cue must score >= 100 points to be safely deleted.
     """
-    tag_pattern = re.compile(r'<[^>]+>|\{\\[^}]+\}')
-    
-    # Hard Promo: Characters practically never say these.
-    hard_verb_pattern = re.compile(r'(?i)(?:sync(?:ed)?|sub(?:title)?s?|subbed|encod(?:ed)?)\s+(?:by|from)')
-    # Soft Promo: Could technically be dialogue ("It was translated by the UN.")
-    soft_verb_pattern = re.compile(r'(?i)(?:download(?:ed)?|correct(?:ed)?|translat(?:ed)?)\s+(?:by|from)')
-    
-    # URLs and Domains
-    url_pattern = re.compile(r'(?i)(?:www\.|https?://|\.com|\.org|\.net|\.tv|\.ro|\.co)')
-    # Known Subtitle keywords
-    url_kw_pattern = re.compile(r'(?i)(?:sub|sync|addic7ed|yts|ganool|opensub|podnapisi|tvsubtitles|subscene|titlovi)')
+    keep = [False] * len(sub)
+    # The Boundary: first 10 and last 10 cues
+    head_end = 10
+    tail_start = len(sub) - 10
     
-    # Scene Release Metadata
-    metadata_pattern = re.compile(r'(?i)(?:s\d{2}e\d{2}|1080p|720p|480p|x264|x265|bluray|web-?rip|hdtv|web-?dl|rip)')
-    
-    valid_cues = []
-    total_cues = len(sub)
+    # Check the bare text so watermarks can't hide inside <font> tags
+    all_bare = _strip_tags_batch([cue.text for cue in sub])
     
-    for i, cue in enumerate(sub):
-        # Check the bare text so watermarks can't hide inside <font> tags
-        bare_text = re.sub(tag_pattern, '', cue.text).strip()
+    for i, bare_text in enumerate(all_bare):
+        in_boundary = i < head_end or i >= tail_start
+        bare_text = bare_text.strip()
         
         # If it's already empty, keep it (the remove_empty_cues function handles blanks)
-        if not bare_text or bare_text in ['.', ',', '?', '-', '..']:
+        if not bare_text or bare_text in _TRIVIAL_TEXT:
+            continue
+        
+        # Ordinary dialogue: nothing here can reach 100 points
+        trigger_re = _WM_TRIGGER_RE if in_boundary else _WM_MIDDLE_TRIGGER_RE
+        if not trigger_re.search(bare_text):
+            keep[i] = True
             continue
             
         score = 0
@@ -203,38 +363,38 @@ def remove_watermarks(sub):
         # --- APPLY HEURISTIC SCORING ---
         
         # The Boundary (First 10 or Last 10 cues)
-        if i < 10 or i > (total_cues - 11):
+        if in_boundary:
             score += 50
             
         # Promo Verbs
-        if re.search(hard_verb_pattern, bare_text):
+        if _HARD_VERB_RE.search(bare_text):
             score += 100
-        elif re.search(soft_verb_pattern, bare_text):
+        elif _SOFT_VERB_RE.search(bare_text):
             score += 80
             
         # URLs
-        if re.search(url_pattern, bare_text):
+        if _URL_RE.search(bare_text):
             score += 40
             # If the URL contains a subtitle keyword (e.g., opensubtitles.org)
-            if re.search(url_kw_pattern, bare_text):
+            if _URL_KW_RE.search(bare_text):
                 score += 60
                 
         # Release Metadata (e.g., S02E01)
-        if re.search(metadata_pattern, bare_text):
+        if _METADATA_RE.search(bare_text):
             score += 60
             
         # Decorative ASCII
         # Looks for lines starting and ending with non-alphanumeric chars
-        if re.search(r'^[^a-zA-Z0-9]+.*[^a-zA-Z0-9]+$', bare_text) and len(bare_text) > 4:
+        if _is_decorative(bare_text):
             score += 20
 
         if score >= 100:
-            # Threshold met! Do NOT append it to valid_cues
+            # Threshold met! Do NOT keep it
             continue
             
-        valid_cues.append(cue)
+        keep[i] = True
         
-    sub[:] = valid_cues
+    sub[:] = list(compress(sub, keep))
     return sub
 
 def fix_capitalization(sub):
@@ -242,54 +402,36 @@ def fix_capitalization(sub):
     Converts ALL-CAPS subtitle lines to Sentence case.
     Safely ignores formatting tags and attempts to preserve English 'I' pronouns.
     """
-    # Regex to capture tags to split the string without losing them
-    tag_pattern = re.compile(r'(<[^>]+>|\{\\[^}]+\})')
-
     for cue in sub:
         original_text = cue.text
+        
+        # Cased text with no uppercase letter anywhere can't hold an ALL-CAPS line.
+        # (Plain \n cues still go through, the rejoin below normalizes mixed newlines)
+        if original_text.islower() and '\n' not in original_text:
+            continue
+        
         nl = r'\N' if r'\N' in original_text else '\n'
-        lines = re.split(r'\\N|\n', original_text)
+        lines = _SPLIT_NL_RE.split(original_text)
         cleaned_lines = []
         
         for line in lines:
             # Check the "bare text" to see if the line is entirely uppercase
-            bare_text = re.sub(tag_pattern, '', line).strip()
+            bare_text = _strip_tag_text(line).strip()
             
             # Only apply fix if the line is 100% uppercase (and contains letters)
-            if bare_text.isupper() and re.search(r'[A-Z]', bare_text):
+            if _is_all_caps(bare_text):
                 
                 # Split the line into a list of [text, tag, text, tag, text...]
-                parts = re.split(tag_pattern, line)
+                parts = _TAG_SPLIT_RE.split(line)
                 capitalize_next = True # Start by capitalizing the first letter of the line
                 
                 for i, part in enumerate(parts):
                     # If this chunk is a tag, leave it completely alone
-                    if re.match(tag_pattern, part):
+                    if _TAG_SPLIT_RE.match(part):
                         continue
                         
-                    # Lowercase the actual text chunk
-                    text = part.lower()
-                    
-                    # Process character by character to handle sentence boundaries
-                    new_text = []
-                    for char in text:
-                        if char.isalpha():
-                            if capitalize_next:
-                                new_text.append(char.upper())
-                                capitalize_next = False
-                            else:
-                                new_text.append(char)
-                        else:
-                            new_text.append(char)
-                            # If punctuation, trigger a capitalization for the next letter
-                            if char in '.!?':
-                                capitalize_next = True
-                                
-                    text = "".join(new_text)
-                    
-                    # English "I" pronoun fix (catches i, i'm, i'll, i've, i'd)
-                    # \b ensures we don't accidentally capitalize the 'i' in 'alien'
-                    text = re.sub(r"\b(i)(['’]?(?:m|ll|ve|d)?)\b", lambda m: "I" + m.group(2), text)
+                    # Lowercase the chunk and re-capitalize sentence starts and "I"
+                    text, capitalize_next = _sentence_case(part, capitalize_next)
                     
                     # Update the chunk
                     parts[i] = text
@@ -88,7 +88,8 @@ def run_extract(args, console):
             console.print(" ⏭️  [dim]No streams selected. Skipping.[/dim]")
             continue
 
-        # Extract the Selected Streams
+        # Plan the extraction of every selected stream first
+        plans = []
         for i in selected_indices:
             stream = streams[i]
             idx = stream.get("index")
@@ -114,8 +115,6 @@ def run_extract(args, console):
                 else: 
                     ext = ".mkv"
 
-            base_name = media_path.stem
-            
             modifier = ""
             if disp.get("hearing_impaired") == 1:
                 modifier = ".hi"
@@ -125,28 +124,54 @@ def run_extract(args, console):
                 modifier = f".track_{idx}"
 
             temp_file = Path(f"temp_extract_{idx}{ext}")
-            
-            # --- EXECUTE EXTRACTION ---
-            console.print(f" 🔧  Extracting Track {idx}...")
-            
+            plans.append((idx, lang, is_text, ext, extract_codec, modifier, temp_file))
+
+        # --- EXECUTE EXTRACTION ---
+        # One ffmpeg run with an output per track, so the container is only read once
+        failed = set()
+        ffmpeg_plans = [p for p in plans if p[3] != ".idx"]
+        if ffmpeg_plans:
+            for idx, *_ in ffmpeg_plans:
+                console.print(f" 🔧  Extracting Track {idx}...")
+            cmd = ["ffmpeg", "-y", "-v", "error", "-i", str(media_path)]
+            for idx, _, _, _, extract_codec, _, temp_file in ffmpeg_plans:
+                cmd.extend(["-map", f"0:{idx}", "-c:s", extract_codec, str(temp_file)])
             try:
-                if ext == ".idx":
-                    cmd = [
-                        "mkvextract", 
-                        str(media_path), 
-                        "tracks", 
-                        f"{idx}:{temp_file}"
-                    ]
+                subprocess.run(cmd, check=True)
+            except subprocess.CalledProcessError:
+                if len(ffmpeg_plans) == 1:
+                    failed.add(ffmpeg_plans[0][0])
                 else:
-                    cmd = [
-                        "ffmpeg", "-y", "-v", "error", 
-                        "-i", str(media_path), 
-                        "-map", f"0:{idx}", 
-                        "-c:s", extract_codec, 
-                        str(temp_file)
-                    ]
+                    # Retry track by track so one bad stream doesn't sink the others
+                    for idx, _, _, _, extract_codec, _, temp_file in ffmpeg_plans:
+                        cmd = [
+                            "ffmpeg", "-y", "-v", "error", 
+                            "-i", str(media_path), 
+                            "-map", f"0:{idx}", 
+                            "-c:s", extract_codec, 
+                            str(temp_file)
+                        ]
+                        try:
+                            subprocess.run(cmd, check=True)
+                        except subprocess.CalledProcessError:
+                            failed.add(idx)
+
+        # mkvextract also takes every VobSub track in one call
+        mkv_plans = [p for p in plans if p[3] == ".idx"]
+        if mkv_plans:
+            for idx, *_ in mkv_plans:
+                console.print(f" 🔧  Extracting Track {idx}...")
+            cmd = ["mkvextract", str(media_path), "tracks"]
+            cmd.extend(f"{idx}:{temp_file}" for idx, *_, temp_file in mkv_plans)
+            try:
                 subprocess.run(cmd, check=True)
-            except subprocess.CalledProcessError as e:
+            except subprocess.CalledProcessError:
+                failed.update(idx for idx, *_ in mkv_plans)
+
+        base_name = media_path.stem
+        
+        for idx, lang, is_text, ext, _, modifier, temp_file in plans:
+            if idx in failed:
                 console.print(f" [bold red]❌ Extraction failed for track {idx}[/bold red]")
                 continue
 
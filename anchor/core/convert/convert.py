@@ -1,10 +1,8 @@
-from pathlib import Path
 from ...utils.selections import select_target_format
 from ...utils.files import open_subtitle
-from ...utils.files import select_files_interactive
-from .image_subtitles import run_ocr_engine
+from ...utils.files import select_files_interactive, get_files
 
-def run_convert(args, device, console):
+def run_convert(args, console):
     console.print("\n[bold blue]🔄 Convert Mode[/bold blue]\n")
 
     # Gather ALL allowed subtitle files (Text + Image formats)
@@ -13,10 +11,7 @@ def run_convert(args, device, console):
     
     allowed_exts = text_exts.union(image_exts)
     
-    available_files = [
-        f for f in Path(".").iterdir() 
-        if f.is_file() and f.suffix.lower() in allowed_exts
-    ]
+    available_files = get_files(allowed_exts)
 
     if not available_files:
         console.print("[yellow]No subtitle files (text or image) found in the current directory.[/yellow]")
@@ -47,6 +42,7 @@ def run_convert(args, device, console):
     console.print(f"\n[bold green]🚀 Starting Conversion to {target_ext.upper()} ({total_files} files)...[/bold green]\n")
 
     # Processing Loop
+    device = None
     for idx, file_path in enumerate(selected_files, 1):
         console.print(f" [black on white] File {idx}/{total_files} [/black on white] [bold cyan]{file_path.name}[/bold cyan]")
         
@@ -61,7 +57,13 @@ def run_convert(args, device, console):
             if file_ext in image_exts:
                 console.print(f"   [yellow]⚠️ Image-based subtitle detected ({file_ext.upper()}). Routing to OCR engine...[/yellow]")
                 
-                # TODO: This is where we will plug in the OCR function!
+                # The hardware check (torch + GPU probing) and the OCR engine (EasyOCR -> torch)
+                # only load once an image subtitle shows up, so text-only conversions don't pay for them
+                if device is None:
+                    from ...hardware import get_compute_device
+                    device = get_compute_device(force_cpu=args.cpu)[0]
+                
+                from .image_subtitles import run_ocr_engine
                 run_ocr_engine(file_path, target_ext, console, device)
                 
                 continue
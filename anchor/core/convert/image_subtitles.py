@@ -1,199 +1,329 @@
+import hashlib
+import io
+import queue
 import subprocess
-import tempfile
+import threading
 import re
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
 from pathlib import Path
+import numpy as np
 import pysubs2
-from PIL import Image
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TimeRemainingColumn
+from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
 
 try:
     import easyocr
 except ImportError:
     easyocr = None
 
-def is_image_blank(img_path: Path):
-    """Instantly checks if an image is completely transparent."""
-    try:
-        with Image.open(img_path) as img:
-            return img.convert("RGBA").getbbox() is None
-    except Exception:
-        return True
+# ffmpeg showinfo log line: the frame's PTS in seconds and its size (s:WxH)
+_SHOWINFO_RE = re.compile(r"pts_time:\s*([0-9.]+).*?\bs:(\d+)x(\d+)")
 
-def are_images_identical(img1_path: Path, img2_path: Path) -> bool:
-    """Checks if two images are pixel-perfect identical to catch .sup duplicate frames."""
-    try:
-        with Image.open(img1_path) as im1, Image.open(img2_path) as im2:
-            # Fast fail if they aren't even the same resolution
-            if im1.size != im2.size:
-                return False
-            # Compare the raw pixel bytes
-            return im1.tobytes() == im2.tobytes()
-    except Exception:
-        return False        
+# OCR punctuation fixes
+_ELLIPSIS_FIXES = (
+    ("___", "..."),
+    ("__.", "..."),
+    ("_..", "..."),
+    (".._", "..."),
+    (".__", "..."),
+    ("._.", "..."),
+    ("_._", "..."),
+    ("_.", "..."),
+    ("._", "..."),
+)
+# An underscore right before a line break (\N) or the end of the string
+_TRAILING_UNDERSCORE_RE = re.compile(r"_+(?=\\N|$)")
+# An underscore attached to a letter/number, right before a space
+_WORD_UNDERSCORE_RE = re.compile(r"(?<=[a-zA-Z0-9])_+(?=\s)")
+# A colon (and any accidental trailing spaces) right before a line break or string end
+_TRAILING_COLON_RE = re.compile(r":\s*(?=\\N|$)")
+
+# ffmpeg log lines (other than showinfo) kept for error messages
+STDERR_TAIL_LINES = 50
+
+# Frames per EasyOCR forward pass on GPU (CPU inference gains nothing from batching)
+OCR_BATCH_SIZE_GPU = 16
+
+def _run_in_bf16(module):
+    """
+    Runs a CUDA model's forward pass under bf16 autocast and hands back float32 tensors.
+    EasyOCR feeds the detector's score maps straight to NumPy/OpenCV, which can't take bf16.
+    """
+    import torch
+    
+    forward = module.forward
+    
+    def forward_bf16(*args, **kwargs):
+        with torch.autocast(device_type="cuda", dtype=torch.bfloat16):
+            out = forward(*args, **kwargs)
+        if isinstance(out, tuple):
+            return tuple(t.float() for t in out)
+        return out.float()
+    
+    module.forward = forward_bf16
+
+# lru_cache doesn't serialize cache misses: a file whose background load was never awaited
+# would let the next file start building a second reader alongside it
+_OCR_READER_LOCK = threading.Lock()
+
+def _get_ocr_reader(use_gpu: bool):
+    """
+    Returns the session's EasyOCR reader, loading it on first use.
+    Converting several image subtitles reuses the models already in memory.
+    """
+    with _OCR_READER_LOCK:
+        return _load_ocr_reader(use_gpu)
+
+@lru_cache(maxsize=None)
+def _load_ocr_reader(use_gpu: bool):
+    """Loads the EasyOCR detector and recognizer."""
+    # quantize=True (EasyOCR's default): on CPU, EasyOCR runs both models with dynamic INT8 linear/LSTM layers.
+    # cudnn_benchmark=True: every frame of a subtitle stream is rendered at the same canvas
+    # size, so letting cuDNN benchmark and pin the fastest conv kernels pays off. EasyOCR
+    # sets the cuDNN flag itself while loading the detector, so it has to be passed here.
+    reader = easyocr.Reader(['en'], gpu=use_gpu, quantize=True, cudnn_benchmark=True, verbose=False)
     
+    if reader.device == "cuda":
+        import torch
+        # Ampere (compute capability 8.x) and newer run bf16 matmuls/convs natively at twice
+        # the FP32 rate; is_bf16_supported() also reports True on older GPUs via slow emulation
+        major, _ = torch.cuda.get_device_capability()
+        if major >= 8:
+            _run_in_bf16(reader.detector)
+            _run_in_bf16(reader.recognizer)
+    
+    return reader
+
+def is_frame_blank(rgba: np.ndarray) -> bool:
+    """Checks if a raw RGBA frame is completely transparent."""
+    return not rgba[..., 3].any()
+
 def clean_ocr_text(text: str) -> str:
     """Fixes common OCR punctuation hallucinations."""
     
-    # Fix broken ellipses
-    ellipses_fixes = {
-        "___": "...",
-        "__.": "...",
-        "_..": "...",
-        ".._": "...",
-        ".__": "...",
-        "._.": "...",
-        "_._": "...",
-        "_.": "...",
-        "._": "...",
-    }
-    for bad, good in ellipses_fixes.items():
-        text = text.replace(bad, good)
+    # Every underscore fix needs an underscore, so clean lines skip them all
+    if '_' in text:
+        # Fix broken ellipses (in order, each replace sees the previous result)
+        for bad, good in _ELLIPSIS_FIXES:
+            text = text.replace(bad, good)
+            
+        # Fix trailing underscore at the end of a line or file
+        text = _TRAILING_UNDERSCORE_RE.sub(".", text)
         
-    # Fix trailing underscore at the end of a line or file
-    # This regex looks for an underscore right before a line break (\N) or the end of the string
-    text = re.sub(r"_+(?=\\N|$)", ".", text)
-    
-    # Fix trailing underscore at the end of a word mid-sentence
-    # This looks for an underscore attached to a letter/number, right before a space
-    text = re.sub(r"(?<=[a-zA-Z0-9])_+(?=\s)", ".", text)
+        # Fix trailing underscore at the end of a word mid-sentence
+        text = _WORD_UNDERSCORE_RE.sub(".", text)
 
     # Fix trailing colon at the end of a line or file
-    # Looks for a colon (and any accidental trailing spaces) right before a line break or string end
-    text = re.sub(r":\s*(?=\\N|$)", ".", text)
+    if ':' in text:
+        text = _TRAILING_COLON_RE.sub(".", text)
     
     return text.strip()    
 
-def add_solid_background(img_path: Path):
+def composite_on_black(rgba: np.ndarray) -> np.ndarray:
     """
-    Replaces transparent pixels with a solid black background.
+    Flattens an RGBA frame onto a solid black background and returns RGB.
     This stops EasyOCR from hallucinating edge-characters like 'l' and 'I'.
+    Over black, alpha compositing is just premultiplying by alpha (same rounding as PIL's paste).
     """
-    try:
-        with Image.open(img_path) as img:
-            # Check if the image has a transparency layer (Alpha)
-            if img.mode in ('RGBA', 'LA') or (img.mode == 'P' and 'transparency' in img.info):
-                img = img.convert("RGBA")
-                
-                # Create a solid black canvas the exact same size as our subtitle
-                bg = Image.new("RGBA", img.size, (0, 0, 0, 255))
-                
-                # Paste the subtitle onto the black canvas, using its own transparency as the glue
-                bg.paste(img, (0, 0), img)
-                
-                # Convert to standard RGB (stripping away the transparency channel forever)
-                final_img = bg.convert("RGB")
-                
-                # Overwrite the image on the hard drive
-                final_img.save(img_path)
-    except Exception as e:
-        pass
+    tmp = rgba[..., :3].astype(np.uint16) * rgba[..., 3:4] + 128
+    return (((tmp >> 8) + tmp) >> 8).astype(np.uint8)
+    
+def ocr_results_to_text(results) -> str:
+    """Clusters EasyOCR text boxes into lines and joins them into one cleaned cue text."""
+    # Cluster boxes into horizontal lines: [y_center, [(x_center, text), ...]].
+    # Boxes are placed greedily in detection order (a subtitle frame has a handful),
+    # so a box joins the first line whose running center is within half its height.
+    lines = []
     
-def extract_subtitle_images(file_path: Path, temp_dir: str, console):
+    for bbox, text, conf in results:
+        y_center = (bbox[0][1] + bbox[2][1]) / 2
+        x_center = (bbox[0][0] + bbox[1][0]) / 2
+        tolerance = (bbox[2][1] - bbox[0][1]) * 0.5
+        
+        for line in lines:
+            if abs(line[0] - y_center) < tolerance:
+                words = line[1]
+                words.append((x_center, text.strip()))
+                line[0] = (line[0] * len(words) + y_center) / (len(words) + 1)
+                break
+        else:
+            lines.append([y_center, [(x_center, text.strip())]])
+    
+    # Sort lines top-to-bottom, and words within each line left-to-right
+    lines.sort(key=itemgetter(0))
+    final_text = "\\N".join(
+        " ".join(text for _, text in sorted(words, key=itemgetter(0)))
+        for _, words in lines
+    )
+    
+    # Run our cleanup filter to fix punctuation!
+    return clean_ocr_text(final_text)
+
+def _batch_frames(frames, batch_size):
+    """
+    Groups consecutive frames into OCR batches of up to batch_size.
+    The detector stacks a batch into one array, so a batch never mixes resolutions.
+    """
+    batch = []
+    batch_dims = None
+    for frame in frames:
+        dims = frame["size"]
+        if batch and (len(batch) >= batch_size or dims != batch_dims):
+            yield batch
+            batch = []
+        batch.append(frame)
+        batch_dims = dims
+    if batch:
+        yield batch
+
+def read_text_frames(reader, images):
+    """
+    Runs EasyOCR on a batch of same-size RGB frames held in memory.
+    readtext() treats a 3-channel array as BGR when it derives the grayscale copy the
+    recognizer reads, so the detector and recognizer are driven directly instead.
+    """
+    import cv2
+    
+    batch = images[0] if len(images) == 1 else np.stack(images)
+    horizontal_lists, free_lists = reader.detect(batch, reformat=False)
+    
+    # The recognizer keeps batch_size=1 (readtext's default): larger batches pad every
+    # crop to the widest one and regroup the boxes, which changes the text it reads
+    return [
+        reader.recognize(
+            cv2.cvtColor(image, cv2.COLOR_RGB2GRAY), horizontal_list, free_list,
+            batch_size=1, reformat=False
+        )
+        for image, horizontal_list, free_list in zip(images, horizontal_lists, free_lists)
+    ]
+
+def extract_subtitle_images(file_path: Path, console):
     """
-    Uses FFmpeg to extract subtitle frames to PNGs and logs the exact PTS of every frame.
+    Uses FFmpeg to render subtitle frames and logs the exact PTS of every frame.
     Uses the timestamp of blank 'clear' frames to calculate perfect durations.
+    Yields each finished event as soon as its end is known, with its image composited in memory.
     """
     input_file = file_path
     if input_file.suffix.lower() == ".sub":
         input_file = input_file.with_suffix(".idx")
         if not input_file.exists():
             console.print(f"[bold red]❌ Critical Error: Missing {input_file.name}![/bold red]")
-            return []
+            return
 
-    # Render all PNGs and use `showinfo` to log the exact PTS of every generated frame
-    img_pattern = str(Path(temp_dir) / "frame_%04d.png")
-    
+    # Stream raw RGBA frames over a pipe and use `showinfo` to log the exact PTS and size
+    # of every frame. Nothing touches the disk: frames go straight from ffmpeg to the OCR.
     ffmpeg_cmd = [
         "ffmpeg", "-y", 
         "-i", str(input_file),
         "-vsync", "0", 
         "-filter_complex", "[0:s:0]format=rgba,showinfo[out]",
         "-map", "[out]",
-        "-c:v", "png",
-        img_pattern
+        "-f", "rawvideo",
+        "-pix_fmt", "rgba",
+        "pipe:1"
     ]
     
     console.print(f"   [dim]🎞️ Rendering frames and analyzing timestamps for {input_file.name}...[/dim]")
     
-    # Changed spinner to "dots" for UI consistency
-    with console.status(" [cyan]Rendering binary frames to PNG (This may take a minute)...[/cyan]", spinner="dots"):
-        process = subprocess.run(ffmpeg_cmd, capture_output=True, text=True)
-        
-    if process.returncode != 0:
-        console.print(f"[bold red]❌ FFmpeg Error:[/bold red]\n{process.stderr}")
-        return []
-
-    # Parse the showinfo log to get the exact PTS for every single frame
-    pts_times = []
-    for line in process.stderr.splitlines():
-        if "showinfo" in line and "pts_time:" in line:
-            match = re.search(r"pts_time:\s*([0-9.]+)", line)
+    # Large stdout buffer: a single 1080p RGBA frame is ~8 MB
+    process = subprocess.Popen(ffmpeg_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, bufsize=1 << 20)
+    
+    # stderr is drained on its own thread (so ffmpeg never blocks on a full pipe);
+    # each showinfo line queues the (pts, width, height) of the next frame on stdout
+    frame_info = queue.Queue()
+    # Only the tail of the other log lines is kept, for the error report
+    stderr_lines = deque(maxlen=STDERR_TAIL_LINES)
+    
+    def read_showinfo():
+        for line in io.TextIOWrapper(process.stderr, errors="replace"):
+            match = _SHOWINFO_RE.search(line) if "showinfo" in line else None
             if match:
-                pts_times.append(float(match.group(1)))
-
-    exported_images = sorted(list(Path(temp_dir).glob("*.png")))
+                frame_info.put((float(match.group(1)), int(match.group(2)), int(match.group(3))))
+            else:
+                stderr_lines.append(line)
+        frame_info.put(None)
     
-    # Safety Check
-    if len(pts_times) != len(exported_images):
-        console.print(f"   [yellow]⚠️ Internal map error: {len(pts_times)} times but {len(exported_images)} images.[/yellow]")
-        min_len = min(len(pts_times), len(exported_images))
-        pts_times = pts_times[:min_len]
-        exported_images = exported_images[:min_len]
+    stderr_thread = threading.Thread(target=read_showinfo, daemon=True)
+    stderr_thread.start()
 
     # Match the timestamps, calculate true durations, and filter duplicates!
-    extracted_data = []
     current_event = None
+    current_fingerprint = None
+    # Digests of every image already handed out, so recurring text (a repeated caption,
+    # a title card) is composited, and later OCR'd, only once
+    seen_images = set()
+    frame_count = 0
     blank_count = 0
     duplicate_count = 0
     
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(bar_width=40),
-        TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-        TimeRemainingColumn(),
-        console=console,
-        transient=True # Disappears when finished
-    ) as progress:
-        
-        analyze_task = progress.add_task(f"[cyan]Filtering {len(exported_images)} extracted frames...", total=len(exported_images))
-        
-        for img_path, pts in zip(exported_images, pts_times):
-            is_blank = is_image_blank(img_path)
+    try:
+        while True:
+            info = frame_info.get()
+            if info is None:
+                break
+            pts, width, height = info
+            
+            buf = process.stdout.read(width * height * 4)
+            if len(buf) < width * height * 4:
+                break
+            
+            frame_count += 1
+            rgba = np.frombuffer(buf, dtype=np.uint8).reshape(height, width, 4)
+            is_blank = is_frame_blank(rgba)
+            # Size + raw bytes: comparing two of these is a straight memcmp that stops at
+            # the first differing byte, cheaper than hashing every frame
+            fingerprint = (width, height, buf)
             
             if is_blank:
                 blank_count += 1
                 if current_event:
                     current_event["end"] = pts
-                    extracted_data.append(current_event)
+                    yield current_event
                     current_event = None
                     
-                img_path.unlink()
+            elif current_event and fingerprint == current_fingerprint:
+                duplicate_count += 1
+                
             else:
-                if current_event and are_images_identical(current_event["img_path"], img_path):
-                    duplicate_count += 1
-                    img_path.unlink()
-                else:
-                    if current_event:
-                        current_event["end"] = pts - 0.1
-                        extracted_data.append(current_event)
-                        
-                    current_event = {
-                        "start": pts,
-                        "end": None,
-                        "img_path": img_path
-                    }
+                if current_event:
+                    current_event["end"] = pts - 0.1
+                    yield current_event
+                
+                digest = hashlib.blake2b(buf, digest_size=16, person=b"%dx%d" % (width, height)).digest()
+                image = None
+                if digest not in seen_images:
+                    # Slide a solid black background behind the text
+                    image = composite_on_black(rgba)
+                    seen_images.add(digest)
                     
-            progress.advance(analyze_task)
+                current_event = {
+                    "start": pts,
+                    "end": None,
+                    "digest": digest,
+                    # None when an earlier event already carries the same image
+                    "image": image,
+                    "size": (width, height)
+                }
+                # Held outside the event so it doesn't pin the raw frame bytes
+                current_fingerprint = fingerprint
+    finally:
+        # Also runs if the consumer stops early: closing the pipe makes ffmpeg exit
+        process.stdout.close()
+        process.wait()
+        stderr_thread.join()
+        
+    if process.returncode != 0:
+        console.print(f"[bold red]❌ FFmpeg Error:[/bold red]\n{''.join(stderr_lines)}")
+        raise subprocess.CalledProcessError(process.returncode, ffmpeg_cmd)
 
     if current_event:
         current_event["end"] = current_event["start"] + 2.0
-        extracted_data.append(current_event)
-
-    console.print(f"   [dim]✅ Processed {len(exported_images)} total frames ({blank_count} clear frames, {duplicate_count} identical duplicates removed).[/dim]")
+        yield current_event
 
-    return extracted_data
+    console.print(f"   [dim]✅ Processed {frame_count} total frames ({blank_count} clear frames, {duplicate_count} identical duplicates removed).[/dim]")
 
 def run_ocr_engine(file_path: Path, target_ext: str, console, device: str):
     """Handles extracting images from binary subtitle formats and running OCR."""
@@ -206,99 +336,69 @@ def run_ocr_engine(file_path: Path, target_ext: str, console, device: str):
 
     console.print(f"   [cyan]⚙️ Initializing OCR Pipeline on {device.upper()}...[/cyan]")
     
-    with tempfile.TemporaryDirectory() as temp_dir:
-        # --- Image Extraction ---
-        try:
-            extracted_frames = extract_subtitle_images(file_path, temp_dir, console)
-            console.print(f"   [bold green]✓[/bold green] Found {len(extracted_frames)} valid text frames.")
-        except Exception as e:
-            console.print(f"   [bold red]❌ Failed to extract images:[/bold red] {e}")
-            return
-
-        if not extracted_frames:
-            console.print("   [yellow]⚠️ No text frames were extracted. Is this file empty?[/yellow]")
-            return
-
-        # --- OCR Brain ---
-        console.print("\n   [dim]👁️ Loading AI Vision model (EasyOCR)...[/dim]")
+    # Load the vision models in the background while ffmpeg renders the first frames
+    # (a no-op after the first file, the reader is cached for the session)
+    use_gpu = device in ["cuda", "xpu"]
+    loader = ThreadPoolExecutor(max_workers=1)
+    reader_future = loader.submit(_get_ocr_reader, use_gpu)
+    loader.shutdown(wait=False)
+    
+    subs = pysubs2.SSAFile()
+    # Image digest -> cleaned text, so a recurring image is only read once
+    ocr_texts = {}
+    frame_total = 0
+    
+    # Frames are OCR'd while ffmpeg is still rendering: only one batch of images is in memory at a time
+    with Progress(
+        SpinnerColumn(),
+        TextColumn("[progress.description]{task.description}"),
+        BarColumn(bar_width=40),
+        console=console,
+        transient=True
+    ) as progress:
         
-        use_gpu = device in ["cuda", "xpu"]
-        with console.status("   [dim]🧠 Loading vision models into memory...[/dim]", spinner="dots"):
-            reader = easyocr.Reader(['en'], gpu=use_gpu, verbose=False)
-
-        subs = pysubs2.SSAFile()
-
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(bar_width=40),
-            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-            TimeRemainingColumn(),
-            console=console,
-            transient=True
-        ) as progress:
-            
-            task = progress.add_task(f" [cyan]🔎 Scanning {len(extracted_frames)} frames...", total=len(extracted_frames))
-            
-            for frame in extracted_frames:
-                # Slide a solid black background behind the text!
-                add_solid_background(frame["img_path"])
-                
-                # Read raw text boxes
-                results = reader.readtext(str(frame["img_path"]))
-                
-                # Cluster boxes into horizontal lines
-                lines_dict = []
-                
-                for bbox, text, conf in results:
-                    y_center = (bbox[0][1] + bbox[2][1]) / 2
-                    x_center = (bbox[0][0] + bbox[1][0]) / 2
-                    height = bbox[2][1] - bbox[0][1]
-                    
-                    placed = False
-                    for line in lines_dict:
-                        if abs(line['y_center'] - y_center) < (height * 0.5):
-                            line['words'].append({'text': text.strip(), 'x': x_center})
-                            line['y_center'] = (line['y_center'] * len(line['words']) + y_center) / (len(line['words']) + 1)
-                            placed = True
-                            break
-                            
-                    if not placed:
-                        lines_dict.append({
-                            'y_center': y_center,
-                            'words': [{'text': text.strip(), 'x': x_center}]
-                        })
-                
-                # Sort lines top-to-bottom
-                lines_dict.sort(key=lambda l: l['y_center'])
+        task = progress.add_task(" [cyan]🧠 Loading vision models into memory...", total=None)
+        
+        # One detector/recognizer pass per batch of same-size frames
+        batch_size = OCR_BATCH_SIZE_GPU if use_gpu else 1
+        try:
+            for batch in _batch_frames(extract_subtitle_images(file_path, console), batch_size):
+                to_read = [f for f in batch if f["image"] is not None]
+                if to_read:
+                    reader = reader_future.result()
+                    batch_results = read_text_frames(reader, [f["image"] for f in to_read])
+                    for frame, results in zip(to_read, batch_results):
+                        ocr_texts[frame["digest"]] = ocr_results_to_text(results)
                 
-                final_lines = []
-                for line in lines_dict:
-                    # Sort words within the line left-to-right
-                    line['words'].sort(key=lambda w: w['x'])
-                    final_lines.append(" ".join([w['text'] for w in line['words']]))
+                for frame in batch:
+                    final_text = ocr_texts[frame["digest"]]
                     
-                final_text = "\\N".join(final_lines)
-                
-                # Run our cleanup filter to fix punctuation!
-                final_text = clean_ocr_text(final_text)
+                    if final_text.strip():
+                        start_ms = int(frame["start"] * 1000)
+                        end_ms = int(frame["end"] * 1000)
+                        
+                        event = pysubs2.SSAEvent(start=start_ms, end=end_ms, text=final_text)
+                        subs.append(event)
                 
-                if final_text.strip():
-                    start_ms = int(frame["start"] * 1000)
-                    end_ms = int(frame["end"] * 1000)
-                    
-                    event = pysubs2.SSAEvent(start=start_ms, end=end_ms, text=final_text)
-                    subs.append(event)
-                    
-                progress.advance(task)
+                frame_total += len(batch)
+                progress.update(task, description=f" [cyan]🔎 Scanning frames ({frame_total} so far)...")
+        except subprocess.CalledProcessError:
+            # extract_subtitle_images already printed ffmpeg's log
+            return
 
-        # --- Save Output ---
-        output_path = file_path.with_suffix(target_ext)
-        subs.save(str(output_path))
-        
-        # --- STOP FILE TIMER AND FORMAT ---
-        file_elapsed = time.perf_counter() - file_start_time
-        mins, secs = divmod(file_elapsed, 60)
-        time_str = f"{int(mins)}m {secs:.1f}s" if mins > 0 else f"{file_elapsed:.1f}s"
-        
-        console.print(f"   [bold green]🔄 OCR Complete in {time_str}! Saved as:[/bold green] {output_path.name}")
\ No newline at end of file
+    if not frame_total:
+        console.print("   [yellow]⚠️ No text frames were extracted. Is this file empty?[/yellow]")
+        return
+    
+    console.print(f"   [bold green]✓[/bold green] Read {frame_total} valid text frames ({len(ocr_texts)} unique images).")
+
+    # --- Save Output ---
+    output_path = file_path.with_suffix(target_ext)
+    subs.save(str(output_path))
+    
+    # --- STOP FILE TIMER AND FORMAT ---
+    file_elapsed = time.perf_counter() - file_start_time
+    mins, secs = divmod(file_elapsed, 60)
+    time_str = f"{int(mins)}m {secs:.1f}s" if mins > 0 else f"{file_elapsed:.1f}s"
+    
+    console.print(f"   [bold green]🔄 OCR Complete in {time_str}! Saved as:[/bold green] {output_path.name}")
@@ -1,17 +1,24 @@
+import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from rich.console import Console
 import re
 import time
-from ...utils.files import select_files_interactive, select_languages_interactive
+from ...utils.files import get_files, select_files_interactive, select_languages_interactive
 from ...utils.selections import get_subtitle_mode
 from .providers.opensubtitles import search_opensubtitles, download_opensubtitles, get_os_token
 from .providers.podnapisi import search_podnapisi, download_podnapisi
 from .providers.subdl import search_subdl, download_subdl
 from .providers.addic7ed import search_addic7ed, download_addic7ed
-from .scoring import calculate_score
+from .scoring import calculate_score, release_text
 from ...utils.hashing import hash_file
 from ...utils.parsers import parse_video_filename
 
+# Release-name flags for the output suffix (.hi / .forced)
+_SDH_RE = re.compile(r'\b(?:hi|sdh|cc)\b')
+_FORCED_RE = re.compile(r'\b(?:forced|foreign)\b')
+
 class SubtitleItem:
     def __init__(self, sub_dict):
         self.sub_dict = sub_dict
@@ -32,6 +39,39 @@ class SubtitleItem:
         self.name = f"[{score_color}][★ {score:4d}][/{score_color}] [yellow][{lang:2s}][/yellow] [magenta][{provider}][/magenta] {filename}"
 
         
+def _search_providers(searches, langs):
+    """
+    Runs every provider search concurrently, one thread per provider.
+    Each provider still walks the languages in order with a 1 second pause between
+    requests to avoid hitting its limits. Results come back in the old serial order
+    (language by language, providers in order), so score ties keep sorting the same way.
+    """
+    def search_provider(search):
+        found = []
+        for i, lang in enumerate(langs):
+            if i:
+                time.sleep(1)
+            found.append(search(lang))
+        return found
+
+    with ThreadPoolExecutor(max_workers=max(1, len(searches))) as pool:
+        per_provider = list(pool.map(search_provider, searches))
+
+    return [sub for i in range(len(langs)) for found in per_provider for sub in found[i]]
+
+def _download_sub(best_sub, file, final_suffix, parsed_data, os_api_key, os_token) -> bool:
+    """Downloads one chosen subtitle through its provider and saves it next to the video."""
+    provider = best_sub["provider"]
+    if provider == "Podnapisi":
+        return download_podnapisi(best_sub["id"], file, custom_suffix=final_suffix)
+    elif provider == "OpenSubs":
+        return download_opensubtitles(best_sub["id"], file, os_api_key, os_token, custom_suffix=final_suffix)
+    elif provider == "SubDL":
+        return download_subdl(best_sub["id"], file, custom_suffix=final_suffix, episode=parsed_data.get("episode"))
+    elif provider == "Addic7ed":
+        return download_addic7ed(best_sub["id"], file, custom_suffix=final_suffix)
+    return False
+
 def run_download(args, config: dict, console: Console):
     console.print("\n[bold cyan]📥 Subtitle Downloader[/bold cyan]")
 
@@ -78,10 +118,7 @@ def run_download(args, config: dict, console: Console):
             available_videos = [target_path]
     elif target_path.is_dir():
         # If they pointed at a folder (or passed nothing), scan the whole directory
-        available_videos = sorted(
-            [f for f in target_path.iterdir() if f.is_file() and f.suffix.lower() in video_extensions],
-            key=lambda x: x.name.lower()
-        )
+        available_videos = sorted(get_files(video_extensions, target_path), key=lambda x: x.name.lower())
 
     if not available_videos:
         console.print(f"[yellow]⚠️ No video files found for target: {target_path.name}[/yellow]")
@@ -154,18 +191,28 @@ def run_download(args, config: dict, console: Console):
         console.print("   [red]❌ Authentication failed. Please check your username and password.[/red]")
         return
 
+    # Lowercased .srt names per folder, listed once for the --missing check
+    srt_names_by_dir = {}
+
+    # Time of the last download per provider, for pacing across files
+    last_download = defaultdict(float)
+
     # --- The Main Download Loop ---
     for file in selected_files:
         console.print(f"\n[cyan]🔍 Processing:[/cyan] {file.name}")
 
         langs_for_file = target_langs_list
         if getattr(args, 'missing', False):
+            srt_names = srt_names_by_dir.get(file.parent)
+            if srt_names is None:
+                with os.scandir(file.parent) as it:
+                    srt_names = [e.name.lower() for e in it if e.name.endswith('.srt')]
+                srt_names_by_dir[file.parent] = srt_names
+            
+            stem = file.stem.lower()
             langs_for_file = [
                 lang for lang in target_langs_list
-                if not any(
-                    f.suffix == '.srt' and f.name.lower().startswith(f"{file.stem.lower()}.{lang.lower()}")
-                    for f in file.parent.iterdir()
-                )
+                if not any(name.startswith(f"{stem}.{lang.lower()}") for name in srt_names)
             ]
             if not langs_for_file:
                 console.print("   [dim]All requested subtitles already present. Skipping.[/dim]")
@@ -178,20 +225,18 @@ def run_download(args, config: dict, console: Console):
         file_hash = hash_file(file)
         parsed_data = parse_video_filename(file)
 
-        results = []
-        with console.status(f"   [dim]Searching subtitles ({file_langs_str})...[/dim]", spinner="dots"):
-            for lang in langs_for_file:
-                if use_opensubtitles:
-                    results += search_opensubtitles(parsed_data, file_hash, lang, os_api_key)
-                if use_subdl:
-                    results += search_subdl(parsed_data, lang, subdl_api_key)
-                if use_podnapisi:
-                    results += search_podnapisi(parsed_data, file_hash, lang)
-                if use_addic7ed:
-                    results += search_addic7ed(parsed_data, file_hash, lang)  
-                # Pause 1 second to avoid hitting limits
-                time.sleep(1)
+        searches = []
+        if use_opensubtitles:
+            searches.append(lambda lang: search_opensubtitles(parsed_data, file_hash, lang, os_api_key))
+        if use_subdl:
+            searches.append(lambda lang: search_subdl(parsed_data, lang, subdl_api_key))
+        if use_podnapisi:
+            searches.append(lambda lang: search_podnapisi(parsed_data, file_hash, lang))
+        if use_addic7ed:
+            searches.append(lambda lang: search_addic7ed(parsed_data, file_hash, lang))
 
+        with console.status(f"   [dim]Searching subtitles on {len(searches)} provider(s) ({file_langs_str})...[/dim]", spinner="dots"):
+            results = _search_providers(searches, langs_for_file)
             
         if not results:
             console.print("   [yellow]⚠️ No subtitles found for this release.[/yellow]")
@@ -239,12 +284,17 @@ def run_download(args, config: dict, console: Console):
                     console.print(f"   [dim]No suitable positive-scoring subtitles found for language: {lang_code.upper()}[/dim]")
             
         # Download & Save All Queued Subs
+        # Names are reserved up front so two subs of one language can't race for the same file
+        planned = []
+        # Names already in the video's folder (casefolded, so case-insensitive filesystems are safe),
+        # listed once and then extended with the names handed out below
+        taken = None
         for best_sub in subs_to_download:
             sub_lang = (best_sub.get('language') or 'en').lower()
             
-            combined_text = (best_sub.get("filename", "") + " " + " ".join(best_sub.get("releases", []))).lower()
-            is_sdh = bool(re.search(r'\b(hi|sdh|cc)\b', combined_text))
-            is_forced = bool(re.search(r'\b(forced|foreign)\b', combined_text))
+            combined_text = release_text(best_sub)
+            is_sdh = bool(_SDH_RE.search(combined_text))
+            is_forced = bool(_FORCED_RE.search(combined_text))
             
             # Build the base custom suffix without the extension
             modifier = ""
@@ -258,35 +308,70 @@ def run_download(args, config: dict, console: Console):
             
             # --- COLLISION DETECTION ---
             # If the file exists on disk, keep bumping the number until we find a free name
+            if taken is None:
+                with os.scandir(file.parent) as it:
+                    taken = {e.name.casefold() for e in it}
+            
             counter = 1
             final_path = file.with_suffix(final_suffix)
             
-            while final_path.exists():
+            while final_path.name.casefold() in taken:
                 final_suffix = f"{base_suffix}.{counter}.srt"
                 final_path = file.with_suffix(final_suffix)
                 counter += 1
             
-            if best_sub["provider"] == "Podnapisi":
-                with console.status(f"   [dim]Downloading {sub_lang.upper()} subtitle from Podnapisi...[/dim]", spinner="dots"):
-                    success = download_podnapisi(best_sub["id"], file, custom_suffix=final_suffix)
-            elif best_sub["provider"] == "OpenSubs":
-                with console.status(f"   [dim]Downloading {sub_lang.upper()} subtitle from OpenSubtitles...[/dim]", spinner="dots"):
-                    success = download_opensubtitles(best_sub["id"], file, os_api_key, os_token, custom_suffix=final_suffix)
-            elif best_sub["provider"] == "SubDL":
-                with console.status(f"   [dim]Downloading {sub_lang.upper()} subtitle from SubDL...[/dim]", spinner="dots"):
-                    success = download_subdl(best_sub["id"], file, custom_suffix=final_suffix, episode=parsed_data.get("episode"))
-            elif best_sub["provider"] == "Addic7ed":
-                with console.status(f"   [dim]Downloading {sub_lang.upper()} subtitle from Addic7ed...[/dim]", spinner="dots"):
-                    success = download_addic7ed(best_sub["id"], file, custom_suffix=final_suffix)
+            taken.add(final_path.name.casefold())
+            planned.append((best_sub, sub_lang, final_suffix, final_path))
+
+        # Different providers download in parallel; each provider's queue stays serial and paced
+        by_provider = {}
+        for job in planned:
+            by_provider.setdefault(job[0]["provider"], []).append(job)
+
+        def download_group(jobs):
+            nonlocal os_token
+            outcomes = {}
+            for best_sub, _, final_suffix, final_path in jobs:
+                provider = best_sub["provider"]
+                
+                # API Pacing (Be polite to the servers!): at most one download per second per provider
+                wait = 1.0 - (time.monotonic() - last_download[provider])
+                if wait > 0:
+                    time.sleep(wait)
+                success = _download_sub(best_sub, file, final_suffix, parsed_data, os_api_key, os_token)
+                last_download[provider] = time.monotonic()
                 
-            if success:
+                # A token OpenSubtitles rejected (401) is dropped from the login cache, so asking
+                # again logs back in; any other failure gets the same cached token and no retry
+                if not success and provider == "OpenSubs":
+                    fresh_token = get_os_token(os_api_key, os_username, os_password)
+                    if fresh_token and fresh_token != os_token:
+                        os_token = fresh_token
+                        wait = 1.0 - (time.monotonic() - last_download[provider])
+                        if wait > 0:
+                            time.sleep(wait)
+                        success = _download_sub(best_sub, file, final_suffix, parsed_data, os_api_key, os_token)
+                        last_download[provider] = time.monotonic()
+                
+                outcomes[final_path] = success
+            return outcomes
+
+        outcomes = {}
+        if planned:
+            langs_str = ", ".join(lang.upper() for _, lang, _, _ in planned)
+            with console.status(f"   [dim]Downloading {langs_str} subtitle(s) from {len(by_provider)} provider(s)...[/dim]", spinner="dots"):
+                with ThreadPoolExecutor(max_workers=len(by_provider)) as pool:
+                    for group_outcomes in pool.map(download_group, by_provider.values()):
+                        outcomes.update(group_outcomes)
+            
+        # Keep the --missing listing current for later videos in this folder with the same stem
+        srt_names = srt_names_by_dir.get(file.parent)
+        for _, sub_lang, _, final_path in planned:
+            if outcomes.get(final_path):
                 console.print(f"   [bold green]💾 Saved subtitle to:[/bold green] {final_path.name}")
+                if srt_names is not None:
+                    srt_names.append(final_path.name.lower())
             else:
                 console.print(f"   [bold red]❌ Failed to download {sub_lang.upper()} subtitle.[/bold red]")
 
-            # API Pacing (Be polite to the servers!)
-            # Only pause if batch processing, and don't pause after the very last file
-            if len(selected_files) > 1 and file != selected_files[-1]:
-                time.sleep(1)    
-
     console.print("\n[bold green]🎉 All downloads complete![/bold green]\n")
\ No newline at end of file
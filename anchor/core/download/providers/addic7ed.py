@@ -5,6 +5,13 @@ from anchor import __version__
 
 GESTDOWN_BASE_URL = "https://api.gestdown.info"
 USER_AGENT = "Anchor-Sub-Sync " + __version__
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Keep-alive connection to Gestdown, shared by the show lookup, subtitle fetches and downloads
+_SESSION = requests.Session()
+
+# Lowercased show title -> Gestdown show UUID (None when Addic7ed doesn't have the show)
+_SHOW_IDS = {}
 
 def map_addic7ed_language(lang_code: str) -> str:
     """
@@ -22,6 +29,33 @@ def map_addic7ed_language(lang_code: str) -> str:
         
     return l
 
+def _find_show_id(clean_title: str, headers: dict):
+    """
+    Looks up the Gestdown show UUID for a title, or None if there is no exact match.
+    Answers are remembered for the session, so a season's worth of episodes only
+    looks the show up once. Failed requests aren't cached and get retried next time.
+    """
+    if clean_title in _SHOW_IDS:
+        return _SHOW_IDS[clean_title]
+
+    safe_title = urllib.parse.quote(clean_title)
+    search_url = f"{GESTDOWN_BASE_URL}/shows/search/{safe_title}"
+    
+    search_resp = _SESSION.get(search_url, headers=headers, timeout=10)
+    if search_resp.status_code != 200:
+        return None
+
+    show_id = None
+    shows = search_resp.json().get("shows", [])
+    # Filter for an exact name match to avoid spin-offs (e.g., "Beyond Stranger Things")
+    for show in shows:
+        if show.get("name", "").lower() == clean_title:
+            show_id = show.get("id")
+            break
+
+    _SHOW_IDS[clean_title] = show_id
+    return show_id
+
 def search_addic7ed(parsed_data: dict, file_hash: str, language: str) -> list:
     """
     Searches Addic7ed via Gestdown for a single language.
@@ -56,19 +90,8 @@ def search_addic7ed(parsed_data: dict, file_hash: str, language: str) -> list:
     # ==========================================
     # STEP 1: Get the exact show UUID
     # ==========================================
-    safe_title = urllib.parse.quote(clean_title)
-    search_url = f"{GESTDOWN_BASE_URL}/shows/search/{safe_title}"
-    
-    show_id = None
     try:
-        search_resp = requests.get(search_url, headers=headers, timeout=10)
-        if search_resp.status_code == 200:
-            shows = search_resp.json().get("shows", [])
-            # Filter for an exact name match to avoid spin-offs (e.g., "Beyond Stranger Things")
-            for show in shows:
-                if show.get("name", "").lower() == clean_title:
-                    show_id = show.get("id")
-                    break
+        show_id = _find_show_id(clean_title, headers)
     except Exception as e:
         print(f"   [red]❌ Addic7ed Search Exception: {e}[/red]")
         return []
@@ -83,7 +106,7 @@ def search_addic7ed(parsed_data: dict, file_hash: str, language: str) -> list:
     url = f"{GESTDOWN_BASE_URL}/subtitles/get/{show_id}/{s_num}/{e_num}/{mapped_lang}"
 
     try:
-        response = requests.get(url, headers=headers, timeout=10)
+        response = _SESSION.get(url, headers=headers, timeout=10)
 
         if response.status_code == 200:
             data = response.json()
@@ -152,26 +175,27 @@ def download_addic7ed(sub_id: str, target_video_path: Path, custom_suffix: str =
     download_url = f"{GESTDOWN_BASE_URL}/subtitles/download/{sub_id}"
 
     try:
-        response = requests.get(download_url, headers=headers, timeout=15)
+        with _SESSION.get(download_url, headers=headers, timeout=15, stream=True) as response:
 
-        if response.status_code == 200:
-            final_path = target_video_path.with_suffix(custom_suffix)
-            content_type = response.headers.get("Content-Type", "").lower()
-            
-            with open(final_path, "wb") as f:
-                if "application/json" in content_type:
-                    # If Gestdown honors the JSON header, the SRT text is inside a dictionary
-                    data = response.json()
-                    srt_text = data.get("content", data.get("text", ""))
-                    f.write(srt_text.encode("utf-8"))
-                else:
-                    # If it ignores the header and dumps the raw SRT bytes
-                    f.write(response.content)
-                    
-            return True
-            
-        else:
-            print(f"   [red]❌ Addic7ed Download Error: API returned {response.status_code}[/red]")
+            if response.status_code == 200:
+                final_path = target_video_path.with_suffix(custom_suffix)
+                content_type = response.headers.get("Content-Type", "").lower()
+                
+                with open(final_path, "wb") as f:
+                    if "application/json" in content_type:
+                        # If Gestdown honors the JSON header, the SRT text is inside a dictionary
+                        data = response.json()
+                        srt_text = data.get("content", data.get("text", ""))
+                        f.write(srt_text.encode("utf-8"))
+                    else:
+                        # If it ignores the header and dumps the raw SRT bytes, stream them to disk
+                        for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                            f.write(chunk)
+                        
+                return True
+                
+            else:
+                print(f"   [red]❌ Addic7ed Download Error: API returned {response.status_code}[/red]")
             
     except Exception as e:
         print(f"   [red]❌ Addic7ed Download Exception: {e}[/red]")
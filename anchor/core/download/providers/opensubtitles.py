@@ -1,9 +1,20 @@
+import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from anchor import __version__
 
 OS_BASE_URL = "https://api.opensubtitles.com/api/v1"
 USER_AGENT = "Anchor-Sub-Sync " + __version__
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+# Re-login a little before the 24h token expiry
+TOKEN_LIFETIME_SEC = 23 * 3600
+
+# Keeps the API connection open between login, searches and download-link requests
+_SESSION = requests.Session()
+
+# (api_key, username, password) -> (token, monotonic expiry time)
+_TOKEN_CACHE = {}
 
 def map_os_language(lang_code: str) -> str:
     """
@@ -23,7 +34,15 @@ def map_os_language(lang_code: str) -> str:
     return l
 
 def get_os_token(api_key: str, username: str, password: str) -> str:
-    """Authenticates with OpenSubtitles to get a Bearer token for downloads."""
+    """
+    Authenticates with OpenSubtitles to get a Bearer token for downloads.
+    Tokens are reused until they expire (24h) or a download rejects them.
+    """
+    cache_key = (api_key, username, password)
+    cached = _TOKEN_CACHE.get(cache_key)
+    if cached and time.monotonic() < cached[1]:
+        return cached[0]
+    
     headers = {
         "Api-Key": api_key,
         "User-Agent": USER_AGENT,
@@ -33,13 +52,26 @@ def get_os_token(api_key: str, username: str, password: str) -> str:
     payload = {"username": username, "password": password}
     
     try:
-        response = requests.post(f"{OS_BASE_URL}/login", headers=headers, json=payload, timeout=10)
+        response = _SESSION.post(f"{OS_BASE_URL}/login", headers=headers, json=payload, timeout=10)
         if response.status_code == 200:
-            return response.json().get("token", "")
+            token = response.json().get("token", "")
+            if token:
+                _TOKEN_CACHE[cache_key] = (token, time.monotonic() + TOKEN_LIFETIME_SEC)
+            return token
     except Exception as e:
         print(f"   [red]❌ OpenSubtitles Login Failed: {e}[/red]")
     return ""
 
+def _fetch_subtitles(headers: dict, params: dict) -> list:
+    """Runs one /subtitles query and returns its hits (empty on any failure)."""
+    try:
+        response = _SESSION.get(f"{OS_BASE_URL}/subtitles", headers=headers, params=params, timeout=10)
+        if response.status_code == 200:
+            return response.json().get("data", [])
+    except Exception:
+        pass
+    return []
+
 def search_opensubtitles(parsed_data: dict, file_hash: str, language: str, api_key: str) -> list:
     """Searches OpenSubtitles using both Hash and Text Metadata."""
     headers = {
@@ -52,37 +84,31 @@ def search_opensubtitles(parsed_data: dict, file_hash: str, language: str, api_k
     requested_lang = language.strip().lower()
     mapped_lang = map_os_language(requested_lang)
     
-    results = []
-    hash_match_found = False
+    # Text metadata query (the fallback when the hash finds nothing)
+    params_text = {
+        "languages": mapped_lang,
+        "query": parsed_data.get("title", "")
+    }
+    if parsed_data.get("year"): params_text["year"] = parsed_data.get("year")
+    if parsed_data.get("season"): params_text["season_number"] = parsed_data.get("season")
+    if parsed_data.get("episode"): params_text["episode_number"] = parsed_data.get("episode")
     
-    # --- ATTEMPT 1: EXACT VIDEO HASH ---
+    # --- ATTEMPT 1: EXACT VIDEO HASH, ATTEMPT 2: TEXT FALLBACK ---
     if file_hash:
+        # The text query is sent alongside the hash query, so a hash miss doesn't cost
+        # a second round-trip. Its answer is simply dropped when the hash matches.
         params_hash = {"languages": mapped_lang, "moviehash": file_hash}
-        try:
-            response = requests.get(f"{OS_BASE_URL}/subtitles", headers=headers, params=params_hash, timeout=10)
-            if response.status_code == 200:
-                results = response.json().get("data", [])
-                if results:
-                    hash_match_found = True  
-        except Exception:
-            pass
-
-    # --- ATTEMPT 2: TEXT FALLBACK ---
-    if not results:
-        params_text = {
-            "languages": mapped_lang,
-            "query": parsed_data.get("title", "")
-        }
-        if parsed_data.get("year"): params_text["year"] = parsed_data.get("year")
-        if parsed_data.get("season"): params_text["season_number"] = parsed_data.get("season")
-        if parsed_data.get("episode"): params_text["episode_number"] = parsed_data.get("episode")
+        pool = ThreadPoolExecutor(max_workers=1)
+        text_future = pool.submit(_fetch_subtitles, headers, params_text)
+        pool.shutdown(wait=False)
         
-        try:
-            response = requests.get(f"{OS_BASE_URL}/subtitles", headers=headers, params=params_text, timeout=10)
-            if response.status_code == 200:
-                results = response.json().get("data", [])
-        except Exception:
-            pass
+        results = _fetch_subtitles(headers, params_hash)
+        hash_match_found = bool(results)
+        if not results:
+            results = text_future.result()
+    else:
+        hash_match_found = False
+        results = _fetch_subtitles(headers, params_text)
 
     # --- NORMALIZE RESULTS ---
     normalized_results = []
@@ -128,8 +154,14 @@ def download_opensubtitles(file_id: int, target_video_path: Path, api_key: str,
     payload = {"file_id": file_id}
     
     try:
-        link_resp = requests.post(f"{OS_BASE_URL}/download", headers=headers, json=payload, timeout=10)
+        link_resp = _SESSION.post(f"{OS_BASE_URL}/download", headers=headers, json=payload, timeout=10)
         
+        if link_resp.status_code == 401:
+            # The token was rejected: forget it so the caller's next get_os_token() logs in again
+            for cache_key, (cached_token, _) in list(_TOKEN_CACHE.items()):
+                if cached_token == token:
+                    del _TOKEN_CACHE[cache_key]
+            return False
         if link_resp.status_code != 200:
             return False
             
@@ -137,15 +169,17 @@ def download_opensubtitles(file_id: int, target_video_path: Path, api_key: str,
         if not download_url:
             return False
             
-        file_resp = requests.get(download_url, timeout=15)
-        if file_resp.status_code == 200:
-            
-            # Apply dynamically built suffix (e.g., .en.hi.srt)
-            final_path = target_video_path.with_suffix(custom_suffix) 
-            
-            with open(final_path, "wb") as f:
-                f.write(file_resp.content)
-            return True
+        # Streamed straight to disk instead of buffering the whole body first
+        with _SESSION.get(download_url, timeout=15, stream=True) as file_resp:
+            if file_resp.status_code == 200:
+                
+                # Apply dynamically built suffix (e.g., .en.hi.srt)
+                final_path = target_video_path.with_suffix(custom_suffix) 
+                
+                with open(final_path, "wb") as f:
+                    for chunk in file_resp.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                return True
             
     except Exception as e:
         print(f"   [red]❌ OS Download Exception: {e}[/red]")
@@ -1,15 +1,36 @@
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import zipfile
-import io
+import tempfile
 from pathlib import Path
 from anchor import __version__
 
 PODNAPISI_BASE_URL = "https://www.podnapisi.net"
 USER_AGENT = "Anchor-Sub-Sync " + __version__
+# Downloaded archives bigger than this are spooled to a temp file instead of RAM
+ARCHIVE_SPOOL_SIZE = 2 * 1024 * 1024
+
+# Hash and text searches go over the same kept-alive connection instead of a new TLS handshake each
+_SESSION = requests.Session()
 
 # Podnapisi uses 2-letter language codes (ISO 639-1), same as OpenSubtitles
 # e.g. "en", "pt", "es", "fr", "de"
 
+def _fetch_subtitles(headers: dict, params: dict) -> list:
+    """Runs one search query and returns its hits (empty on any failure)."""
+    try:
+        response = _SESSION.get(
+            f"{PODNAPISI_BASE_URL}/subtitles/search/",
+            headers=headers,
+            params=params,
+            timeout=10,
+        )
+        if response.status_code == 200:
+            return response.json().get("subtitles", [])
+    except Exception:
+        pass
+    return []
+
 def search_podnapisi(parsed_data: dict, file_hash: str, language: str, ) -> list:
     """
     Searches Podnapisi using both Hash and Text Metadata.
@@ -28,56 +49,36 @@ def search_podnapisi(parsed_data: dict, file_hash: str, language: str, ) -> list
     hash_match_found = False
 
     for lang in langs:
-        results_for_lang = []
-        lang_hash_match = False
-
-        # --- ATTEMPT 1: HASH SEARCH ---
+        # Text metadata query (the fallback when the hash finds nothing)
+        params_text = {
+            "keywords": parsed_data.get("title", ""),
+            "language": lang,
+        }
+        if parsed_data.get("year"):
+            params_text["year"] = parsed_data.get("year")
+        if parsed_data.get("season"):
+            params_text["season"] = parsed_data.get("season")
+        if parsed_data.get("episode"):
+            params_text["episode"] = parsed_data.get("episode")
+
+        # --- ATTEMPT 1: HASH SEARCH, ATTEMPT 2: TEXT FALLBACK ---
         if file_hash:
+            # Both queries go out together; the text hits are only used on a hash miss
             params_hash = {
                 "moviehash": file_hash,
                 "language": lang,
             }
-            try:
-                response = requests.get(
-                    f"{PODNAPISI_BASE_URL}/subtitles/search/",
-                    headers=headers,
-                    params=params_hash,
-                    timeout=10,
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    hits = data.get("subtitles", [])
-                    if hits:
-                        results_for_lang = hits
-                        lang_hash_match = True
-            except Exception:
-                pass
-
-        # --- ATTEMPT 2: TEXT FALLBACK ---
-        if not results_for_lang:
-            params_text = {
-                "keywords": parsed_data.get("title", ""),
-                "language": lang,
-            }
-            if parsed_data.get("year"):
-                params_text["year"] = parsed_data.get("year")
-            if parsed_data.get("season"):
-                params_text["season"] = parsed_data.get("season")
-            if parsed_data.get("episode"):
-                params_text["episode"] = parsed_data.get("episode")
-
-            try:
-                response = requests.get(
-                    f"{PODNAPISI_BASE_URL}/subtitles/search/",
-                    headers=headers,
-                    params=params_text,
-                    timeout=10,
-                )
-                if response.status_code == 200:
-                    data = response.json()
-                    results_for_lang = data.get("subtitles", [])
-            except Exception:
-                pass
+            pool = ThreadPoolExecutor(max_workers=1)
+            text_future = pool.submit(_fetch_subtitles, headers, params_text)
+            pool.shutdown(wait=False)
+
+            results_for_lang = _fetch_subtitles(headers, params_hash)
+            lang_hash_match = bool(results_for_lang)
+            if not results_for_lang:
+                results_for_lang = text_future.result()
+        else:
+            lang_hash_match = False
+            results_for_lang = _fetch_subtitles(headers, params_text)
 
         # --- NORMALIZE RESULTS ---
         for sub in results_for_lang:
@@ -109,6 +110,17 @@ def search_podnapisi(parsed_data: dict, file_hash: str, language: str, ) -> list
     return all_results
 
 
+def _spool_body(response) -> tempfile.SpooledTemporaryFile:
+    """
+    Streams a response body into a file object that stays in memory while small
+    and spills to a temp file past ARCHIVE_SPOOL_SIZE, ready to read from the start.
+    """
+    spool = tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_SIZE)
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
 def download_podnapisi(sub_id: str, target_video_path: Path, custom_suffix: str = ".srt") -> bool:
     """
     Downloads a subtitle ZIP from Podnapisi, extracts the first .srt inside,
@@ -122,13 +134,13 @@ def download_podnapisi(sub_id: str, target_video_path: Path, custom_suffix: str
     download_url = f"{PODNAPISI_BASE_URL}/subtitles/{sub_id}/download"
 
     try:
-        response = requests.get(download_url, headers=headers, timeout=15)
-
-        if response.status_code != 200:
-            return False
+        with _SESSION.get(download_url, headers=headers, timeout=15, stream=True) as response:
+            if response.status_code != 200:
+                return False
+            archive = _spool_body(response)
 
         # The download is always a .zip containing one or more subtitle files
-        with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+        with archive, zipfile.ZipFile(archive) as zf:
             # Find the first .srt, .sub, or .ass inside the archive
             srt_names = [
                 name for name in zf.namelist()
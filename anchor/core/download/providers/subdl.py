@@ -2,17 +2,22 @@ import re
 import time
 import requests
 import zipfile
-import io
 import subprocess
 import tempfile
 import shutil
 import unicodedata
+from functools import lru_cache
 from pathlib import Path
 from anchor import __version__
 
 SUBDL_SEARCH_URL = "https://api.subdl.com/api/v1/subtitles"
 SUBDL_DOWNLOAD_BASE = "https://dl.subdl.com"
 USER_AGENT = "Anchor-Sub-Sync " + __version__
+# ZIP/RAR downloads up to this size stay in memory, bigger ones go to a temp file
+ARCHIVE_SPOOL_SIZE = 2 * 1024 * 1024
+
+# Reused across searches, disambiguation retries and downloads (HTTP keep-alive)
+_SESSION = requests.Session()
 
 def map_subdl_language(lang_code: str) -> str:
     """
@@ -30,14 +35,20 @@ def map_subdl_language(lang_code: str) -> str:
         
     return l.upper()
 
+_SEPARATORS_RE = re.compile(r'[\._]')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+
 def _normalize_title(title: str) -> str:
-    t = re.sub(r'[\._]', ' ', title.lower())
-    return re.sub(r'[^\w\s]', '', t).strip()
+    t = _SEPARATORS_RE.sub(' ', title.lower())
+    return _PUNCTUATION_RE.sub('', t).strip()
 
 def sanitize_filename(text: str) -> str:
     """Crushes weird Unicode/Fullwidth fonts back to standard ASCII."""
     if not text:
         return ""
+    # Plain ASCII is already NFKC-normal, which is nearly every release name
+    if text.isascii():
+        return text
     # NFKC converts compatibility characters (like ＷＥＢ) to their standard equivalents (WEB)
     return unicodedata.normalize('NFKC', text)
 
@@ -75,15 +86,13 @@ _LANG_NAME_TO_CODE = {
     "czech": "cs", "hungarian": "hu", "romanian": "ro", "greek": "el",
     "hebrew": "he", "croatian": "hr", "serbian": "sr", "slovak": "sk",
     "slovenian": "sl", "bulgarian": "bg", "ukrainian": "uk",
+    "br": "pt-br",
 }
 
 def _normalize_lang_code(raw: str) -> str:
     """Converts 'English' or 'EN' to 'en' for pipeline consistency."""
     cleaned = raw.strip().lower()
-    if cleaned == "br":
-        return "pt-br"
-    if len(cleaned) == 2:
-        return cleaned
+    # Any other 2-letter code is its own first two letters, so one lookup covers every case
     return _LANG_NAME_TO_CODE.get(cleaned, cleaned[:2])
 
 
@@ -95,7 +104,7 @@ def _get_with_retry(url: str, headers: dict, params: dict) -> requests.Response:
     """GET with automatic retry on timeout."""
     for attempt in range(_SUBDL_RETRIES):
         try:
-            return requests.get(url, headers=headers, params=params, timeout=_SUBDL_TIMEOUT)
+            return _SESSION.get(url, headers=headers, params=params, timeout=_SUBDL_TIMEOUT)
         except requests.exceptions.Timeout:
             if attempt < _SUBDL_RETRIES - 1:
                 time.sleep(_SUBDL_RETRY_DELAY)
@@ -226,7 +235,7 @@ def search_subdl(parsed_data: dict, language: str, api_key: str) -> list:
         # so we can compare it directly against the original requested language!
         if sub["language"] == requested_lang_lower:
             sub["filename"] = sanitize_filename(sub.get("filename", ""))
-            if "releases" in sub:
+            if "releases" in sub and not all(r.isascii() for r in sub["releases"]):
                 sub["releases"] = [sanitize_filename(r) for r in sub["releases"]]
                 
             filtered_results.append(sub)
@@ -234,6 +243,14 @@ def search_subdl(parsed_data: dict, language: str, api_key: str) -> list:
     return filtered_results
 
 
+def _spool_body(response) -> tempfile.SpooledTemporaryFile:
+    """Copies a streamed download into a SpooledTemporaryFile, rewound for reading."""
+    spool = tempfile.SpooledTemporaryFile(max_size=ARCHIVE_SPOOL_SIZE)
+    for chunk in response.iter_content(chunk_size=64 * 1024):
+        spool.write(chunk)
+    spool.seek(0)
+    return spool
+
 def download_subdl(url_path: str, target_video_path: Path, custom_suffix: str = ".srt", episode: str = None) -> bool:
     """
     Downloads a subtitle ZIP/RAR from SubDL, extracts the right .srt inside,
@@ -246,16 +263,16 @@ def download_subdl(url_path: str, target_video_path: Path, custom_suffix: str =
     download_url = f"{SUBDL_DOWNLOAD_BASE}{url_path}"
 
     try:
-        response = requests.get(download_url, headers=headers, timeout=15)
-
-        if response.status_code != 200:
-            return False
+        with _SESSION.get(download_url, headers=headers, timeout=15, stream=True) as response:
+            if response.status_code != 200:
+                return False
+            archive = _spool_body(response)
 
         final_path = target_video_path.with_suffix(custom_suffix)
 
         try:
             # ATTEMPT 1: Try to open it as a standard ZIP archive
-            with zipfile.ZipFile(io.BytesIO(response.content)) as zf:
+            with zipfile.ZipFile(archive) as zf:
                 srt_names = [
                     name for name in zf.namelist()
                     if name.lower().endswith((".srt", ".sub", ".ass", ".vtt"))
@@ -274,7 +291,10 @@ def download_subdl(url_path: str, target_video_path: Path, custom_suffix: str =
             # ATTEMPT 2: FALLBACK (It's not a ZIP archive)
             
             # Check for the dreaded RAR format using its magic bytes
-            if response.content.startswith(b'Rar!'):
+            archive.seek(0)
+            is_rar = archive.read(4) == b'Rar!'
+            archive.seek(0)
+            if is_rar:
                 # 1. Check if unrar is actually installed on the system
                 if not shutil.which("unrar"):
                     print("   [yellow]⚠️ SubDL served a .RAR archive, but 'unrar' is missing from your system. Skipping...[/yellow]")
@@ -287,7 +307,7 @@ def download_subdl(url_path: str, target_video_path: Path, custom_suffix: str =
                         
                         # Save the raw RAR bytes to disk
                         with open(temp_rar_path, "wb") as tr:
-                            tr.write(response.content)
+                            shutil.copyfileobj(archive, tr)
                             
                         # Call system unrar: 'unrar e -y temp.rar temp_dir/'
                         subprocess.run(
@@ -319,14 +339,22 @@ def download_subdl(url_path: str, target_video_path: Path, custom_suffix: str =
             
             # ATTEMPT 3: It's just a raw text stream (.srt, .ass, etc.)
             with open(final_path, "wb") as f:
-                f.write(response.content)
+                shutil.copyfileobj(archive, f)
             return True
 
+        finally:
+            archive.close()
+
     except Exception as e:
         print(f"   [red]❌ SubDL Download Exception: {e}[/red]")
 
     return False
 
+@lru_cache(maxsize=None)
+def _episode_pattern(ep_num: str) -> re.Pattern:
+    """Matches patterns like S01E01, E01, _01_, .01. for a zero-padded episode number."""
+    return re.compile(rf'[Ee]{ep_num}|[^0-9]{ep_num}[^0-9]')
+
 def _pick_episode_from_pack(srt_names: list, episode: str) -> str:
     """
     Given a list of .srt filenames from a ZIP, returns the best match
@@ -335,12 +363,7 @@ def _pick_episode_from_pack(srt_names: list, episode: str) -> str:
     if not episode or len(srt_names) == 1:
         return srt_names[0]
 
-    ep_num = str(episode).zfill(2)  # "1" -> "01"
-
-    # Match patterns like S01E01, E01, _01_, .01.
-    ep_pattern = re.compile(
-        rf'[Ee]{ep_num}|[^0-9]{ep_num}[^0-9]',
-    )
+    ep_pattern = _episode_pattern(str(episode).zfill(2))  # "1" -> "01"
 
     for name in srt_names:
         if ep_pattern.search(name):
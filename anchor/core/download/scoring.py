@@ -1,53 +1,118 @@
 import re
 import difflib
+from functools import lru_cache
 from ...utils.parsers import parse_video_filename
 
+# Try to import rapidfuzz for a native (C++) title similarity bound
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
+# Title normalization: split camelCase words, dots/underscores to spaces, drop punctuation
+_CAMEL_LOWER_UPPER_RE = re.compile(r'(?<=[a-z])(?=[A-Z])')
+_CAMEL_ACRONYM_RE = re.compile(r'(?<=[A-Z])(?=[A-Z][a-z])')
+_SEPARATORS_RE = re.compile(r'[\._]')
+_PUNCTUATION_RE = re.compile(r'[^\w\s]')
+_ARTICLE_RE = re.compile(r'^(the|a|an)\s+')
+
+# Release-name flags for the SDH / forced preferences
+_SDH_RE = re.compile(r'\b(?:hi|sdh|cc)\b')
+_FORCED_RE = re.compile(r'\b(?:forced|foreign)\b')
+
+# Edition / cut markers; the lookahead also catches editions that overlap in a string
+_EDITIONS_RE = re.compile(r'(?=(extended|unrated|director|remastered))')
+
+@lru_cache(maxsize=4096)
 def normalize_title(title: str) -> str:
-    t = re.sub(r'(?<=[a-z])(?=[A-Z])', ' ', title)
-    t = re.sub(r'(?<=[A-Z])(?=[A-Z][a-z])', ' ', t)
-    t = re.sub(r'[\._]', ' ', t.lower())
-    return re.sub(r'[^\w\s]', '', t).strip()
+    t = _CAMEL_LOWER_UPPER_RE.sub(' ', title)
+    t = _CAMEL_ACRONYM_RE.sub(' ', t)
+    t = _SEPARATORS_RE.sub(' ', t.lower())
+    return _PUNCTUATION_RE.sub('', t).strip()
 
+@lru_cache(maxsize=4096)
 def strip_articles(title: str) -> str:
     """Removes leading articles for a base comparison."""
-    return re.sub(r'^(the|a|an)\s+', '', title).strip()
+    return _ARTICLE_RE.sub('', title).strip()
+
+@lru_cache(maxsize=4096)
+def _parse_candidate(filename: str) -> dict:
+    """
+    parse_video_filename for a candidate's filename, memoized: providers often list the
+    same release names for every language, and the parsed dict is only ever read.
+    """
+    return parse_video_filename(filename)
+
+@lru_cache(maxsize=4096)
+def _editions(text: str) -> frozenset:
+    return frozenset(_EDITIONS_RE.findall(text))
+
+def release_text(sub_dict: dict) -> str:
+    """The candidate's filename and release tags as one lowercased string, built once per candidate."""
+    text = sub_dict.get("_release_text")
+    if text is None:
+        text = " ".join([sub_dict.get("filename", ""), *(sub_dict.get("releases") or [])]).lower()
+        sub_dict["_release_text"] = text
+    return text
+
+def _titles_similar(a: str, b: str, threshold: float = 0.80) -> bool:
+    """
+    Whether difflib's SequenceMatcher ratio of two titles is above threshold.
+    Cheap upper bounds on that ratio reject most pairs before the full pure-Python match:
+    the length bound, then rapidfuzz's C++ Indel similarity (2*LCS / total length, and
+    difflib's matching blocks can never beat the longest common subsequence).
+    """
+    if 2 * min(len(a), len(b)) / (len(a) + len(b)) <= threshold:
+        return False
+    
+    matcher = difflib.SequenceMatcher(None, a, b)
+    if Indel is not None:
+        if Indel.normalized_similarity(a, b) <= threshold:
+            return False
+    elif matcher.quick_ratio() <= threshold:
+        return False
+    
+    return matcher.ratio() > threshold
 
 def calculate_score(target_parsed: dict, sub_dict: dict, target_langs_list: list, prefer_sdh: bool = False, prefer_forced: bool = False) -> int:
-    sub_parsed = parse_video_filename(sub_dict.get("filename", ""))
+    sub_parsed = _parse_candidate(sub_dict.get("filename", ""))
     
     # --- 1. Is it the correct show/movie? ---
-    target_norm = normalize_title(target_parsed.get("title", ""))
-    sub_norm = normalize_title(sub_parsed.get("title", ""))
-    target_base = strip_articles(target_norm)
-    sub_base = strip_articles(sub_norm)
+    # The cheap season/episode/year checks run first: a mismatch fails the candidate
+    # whatever its title, so there's no point normalizing and fuzzy-matching it.
     
-    is_correct_show = False
-    
-    # A. Check the title
-    if target_norm == sub_norm or target_base == sub_base:
-        is_correct_show = True
-    elif target_base and sub_base:
-        similarity = difflib.SequenceMatcher(None, target_base, sub_base).ratio()
-        if similarity > 0.80:
-            is_correct_show = True
-            
-    # B. Strict TV Check
+    # A. Strict TV Check
     t_season = target_parsed.get("season")
     t_ep = target_parsed.get("episode")
     s_season = sub_parsed.get("season")
     s_ep = sub_parsed.get("episode")
 
     if t_season and s_season and t_season != s_season:
-        is_correct_show = False
+        return -100
     elif t_ep and s_ep and t_ep != s_ep:
-        is_correct_show = False
+        return -100
 
-    # C. Strict Year Check (Crucial for Movies)
+    # B. Strict Year Check (Crucial for Movies)
     t_year = target_parsed.get("year")
     s_year = sub_parsed.get("year")
     
     if t_year and s_year and t_year != s_year:
-        is_correct_show = False
+        return -100
+
+    # C. Check the title
+    # (the title helpers are memoized, so the target side is only worked out once per ranking)
+    target_norm = normalize_title(target_parsed.get("title", ""))
+    sub_norm = normalize_title(sub_parsed.get("title", ""))
+    target_base = strip_articles(target_norm)
+    sub_base = strip_articles(sub_norm)
+    
+    is_correct_show = False
+    
+    if target_norm == sub_norm or target_base == sub_base:
+        is_correct_show = True
+    elif target_base and sub_base:
+        if _titles_similar(target_base, sub_base):
+            is_correct_show = True
 
     # IF IT IS THE WRONG SHOW, INSTANTLY FAIL IT!
     if not is_correct_show:
@@ -58,26 +123,22 @@ def calculate_score(target_parsed: dict, sub_dict: dict, target_langs_list: list
     score = 100 if is_hash_match else 10
         
     # --- 3. ADDITIVE CRITERIA ---
-    combined_text = (sub_dict.get("filename", "") + " " + " ".join(sub_dict.get("releases", []))).lower()
+    combined_text = release_text(sub_dict)
 
     # Edition / Cut Match (EXTENDED, UNRATED, DIRECTOR'S CUT)
     target_raw = target_parsed.get("raw_filename", "").lower()
-    editions = ['extended', 'unrated', 'director', 'remastered']
+    t_editions = _editions(target_raw)
+    s_editions = _editions(combined_text)
     
-    for ed in editions:
-        t_has_ed = ed in target_raw
-        s_has_ed = ed in combined_text
-        
-        if t_has_ed and s_has_ed:
-            score += 15
-        elif t_has_ed != s_has_ed and not is_hash_match:
-            # Heavy penalty if one is extended and the other isn't (guaranteed desync)
-            # Ignore this penalty ONLY if provider guarantees a perfect video hash match.
-            score -= 20
-
-    # Source Match
-    p_source = target_parsed.get("source", "").upper()
-    s_source = sub_parsed.get("source", "").upper()
+    score += 15 * len(t_editions & s_editions)
+    if not is_hash_match:
+        # Heavy penalty if one is extended and the other isn't (guaranteed desync)
+        # Ignore this penalty ONLY if provider guarantees a perfect video hash match.
+        score -= 20 * len(t_editions ^ s_editions)
+
+    # Source Match (parse_video_filename already upper-cases it)
+    p_source = target_parsed.get("source", "")
+    s_source = sub_parsed.get("source", "")
     if p_source and s_source:
         if p_source == s_source:
             score += 20  
@@ -107,7 +168,7 @@ def calculate_score(target_parsed: dict, sub_dict: dict, target_langs_list: list
     # --- 4. PREFERENCES (+5 for match, -10 for mismatch) ---
     
     # SDH check
-    is_sdh = bool(re.search(r'\b(hi|sdh|cc)\b', combined_text)) or sub_dict.get("_is_hi", False)
+    is_sdh = bool(_SDH_RE.search(combined_text)) or sub_dict.get("_is_hi", False)
     if prefer_sdh:
         if is_sdh:
             score += 5
@@ -120,7 +181,7 @@ def calculate_score(target_parsed: dict, sub_dict: dict, target_langs_list: list
             score -= 10
 
     # Forced check
-    is_forced = bool(re.search(r'\b(forced|foreign)\b', combined_text))
+    is_forced = bool(_FORCED_RE.search(combined_text))
     if prefer_forced:
         if is_forced:
             score += 5
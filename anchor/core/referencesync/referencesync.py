@@ -8,7 +8,7 @@ from ...utils.files import get_files, open_subtitle, select_files_interactive, b
 from ...utils.mappings import get_language_code_for_nllb
 from ...utils.languages import get_subtitle_language
 from ..translation import translate_subtitle_nllb
-from ...utils.whisper import GlobalAligner
+from ...utils.alignment import GlobalAligner, copy_timestamps
 
 SUPPORTED_EXTENSIONS = {".srt", ".ass", ".vtt", ".sub"}
 
@@ -185,9 +185,7 @@ def run_referencesync(args, device, translation_model, compute_type, console):
                 console.print("[dim]📥 Applying synced timestamps back to original subtitle...[/dim]")
                 synced_ghost = pysubs2.load(str(out_path))
                 
-                for orig_event, ghost_event in zip(original_sub_object, synced_ghost):
-                    orig_event.start = ghost_event.start
-                    orig_event.end = ghost_event.end
+                copy_timestamps(original_sub_object, synced_ghost)
                 
                 if args and getattr(args, "overwrite", False):
                     backup_if_needed(target_sub, args)
@@ -5,6 +5,7 @@ import os
 import sys
 import subprocess
 from rich.console import Console
+from .pytorch_compat import ensure_patches
 
 # Try to import psutil for accurate CPU RAM detection
 try:
@@ -116,10 +117,28 @@ def select_translation_model(memory_gb, is_gpu=True):
     else:
         return NLLB_600M
 
+def select_cuda_compute_type():
+    """
+    Picks the lowest precision CTranslate2 runs well on this NVIDIA GPU:
+    int8_float16 on Ampere and newer (INT8 tensor cores), float16 otherwise.
+    """
+    try:
+        major, _ = torch.cuda.get_device_capability()
+        if major >= 8:
+            import ctranslate2
+            if "int8_float16" in ctranslate2.get_supported_compute_types("cuda"):
+                return "int8_float16"
+    except Exception:
+        pass
+    return "float16"
+
 def get_compute_device(force_model=None, force_batch=None, force_translation_model=None, force_cpu=False):
     """
     Detects hardware and selects optimal settings + Whisper model + Translation model.
     """
+    # First torch touchpoint of the model-running modes, ahead of any whisperx import
+    ensure_patches()
+
     device = "cpu"
     compute_type = "int8"
     batch_size = 4
@@ -209,7 +228,7 @@ def get_compute_device(force_model=None, force_batch=None, force_translation_mod
                 min_mem_gb = 4 
 
             device = "cuda"
-            compute_type = "float16"
+            compute_type = select_cuda_compute_type()
             
             model_size = select_model_size(min_mem_gb, is_gpu=True)
             translation_model = select_translation_model(min_mem_gb, is_gpu=True)
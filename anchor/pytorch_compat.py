@@ -1,11 +1,25 @@
-import torch
 import inspect
 
+_patches_applied = False
+
+def ensure_patches():
+    """
+    Applies the runtime patches once, on first need.
+    Must be called before whisperx (and therefore pyannote) is imported.
+    """
+    global _patches_applied
+    if _patches_applied:
+        return
+    apply_patches()
+    _patches_applied = True
+
 def apply_patches():
     """
     Applies critical runtime patches. 
     Safe for both new PyTorch (2.6+) and older versions.
     """
+    import torch
+
     # 1. Capture original
     _original_torch_load = torch.load
 
@@ -19,4 +33,47 @@ def apply_patches():
             kwargs['weights_only'] = False 
             return _original_torch_load(*args, **kwargs)
             
-        torch.load = patched_load
\ No newline at end of file
+        torch.load = patched_load
+
+    _patch_torchaudio()
+
+def _patch_torchaudio():
+    """
+    torchaudio 2.11+ removed AudioMetaData and torchaudio.info; pyannote 3.x needs both.
+    Must run before whisperx (and therefore pyannote) is imported.
+    """
+    import torchaudio as _torchaudio
+    if not hasattr(_torchaudio, "AudioMetaData"):
+        from dataclasses import dataclass
+
+        @dataclass
+        class _AudioMetaData:
+            sample_rate: int
+            num_frames: int
+            num_channels: int
+            bits_per_sample: int
+            encoding: str
+
+        _torchaudio.AudioMetaData = _AudioMetaData
+
+    if not hasattr(_torchaudio, "info"):
+        import soundfile as _sf
+
+        def _torchaudio_info(path, format=None, backend=None):
+            info = _sf.info(path)
+            # subtype is like "PCM_16", "PCM_24", "FLOAT" — extract the numeric part
+            import re as _re
+            bps_match = _re.search(r'(\d+)', info.subtype)
+            bits_per_sample = int(bps_match.group(1)) if bps_match else 0
+            return _torchaudio.AudioMetaData(
+                sample_rate=info.samplerate,
+                num_frames=info.frames,
+                num_channels=info.channels,
+                bits_per_sample=bits_per_sample,
+                encoding=info.subtype,
+            )
+
+        _torchaudio.info = _torchaudio_info
+
+    if not hasattr(_torchaudio, "list_audio_backends"):
+        _torchaudio.list_audio_backends = lambda: ["soundfile"]
@@ -1,69 +1,146 @@
+import array
 import pysubs2
 import difflib
 import numpy as np
+from functools import lru_cache
+from operator import attrgetter
+from dataclasses import dataclass, replace
+from typing import Optional
 from rich.console import Console
 from .formatting import clean_text
 
+# Try to import rapidfuzz for a native (C++) sequence aligner
+try:
+    from rapidfuzz.distance import Indel
+except ImportError:
+    Indel = None
+
 # ================= CONSTANTS =================
 SCENE_GAP_SEC = 5.0          
 MIN_DURATION_MS = 600        
 GAP_MS = 50                  
-OUTLIER_THRESHOLD_SEC = 1.5  
+MIN_OUTLIER_SEC = 0.5        # Floor, so word-timing jitter never counts as an outlier
+OUTLIER_SIGMA = 3.0          # Hampel identifier width, in robust standard deviations
+VERBOSE = False              # Print a trace line per aligner stage
 # =============================================
 
 console = Console()
 
+# Whisper words repeat heavily (articles, stop-words), so memoize the per-word clean
+_clean_word = lru_cache(maxsize=65536)(clean_text)
+
+@dataclass
+class Anchors:
+    """Matched subtitle lines as parallel arrays, one entry per anchor."""
+    idx: np.ndarray
+    orig_start: np.ndarray
+    raw_match: np.ndarray
+    drift: np.ndarray
+    final_start: Optional[np.ndarray] = None
+
+    def __len__(self):
+        return len(self.idx)
+
+    def select(self, mask):
+        """Returns the anchors where mask (bool array or indices) is set."""
+        return Anchors(
+            idx=self.idx[mask],
+            orig_start=self.orig_start[mask],
+            raw_match=self.raw_match[mask],
+            drift=self.drift[mask],
+            final_start=None if self.final_start is None else self.final_start[mask],
+        )
+
 def smooth_offsets_by_block(anchors):
-    if not anchors: return []
-    console.print("[dim]   ⚖️ Applying Block Averaging (Smoothing)...[/dim]")
-    
-    scenes = []
-    current_scene = [anchors[0]]
+    if not anchors: return anchors
+    if VERBOSE: console.print("[dim]   ⚖️ Applying Block Averaging (Smoothing)...[/dim]")
     
-    for i in range(1, len(anchors)):
-        prev = anchors[i-1]
-        curr = anchors[i]
-        
-        if (curr['orig_start'] - prev['orig_start']) > SCENE_GAP_SEC:
-            scenes.append(current_scene)
-            current_scene = []
-        current_scene.append(curr)
-    scenes.append(current_scene)
+    # A new scene starts wherever consecutive anchors are more than SCENE_GAP_SEC apart
+    breaks = np.flatnonzero(np.diff(anchors.orig_start) > SCENE_GAP_SEC) + 1
+    bounds = np.concatenate(([0], breaks, [len(anchors)]))
     
-    smoothed = []
-    for scene in scenes:
-        drifts = [(a['raw_match_time'] - a['orig_start']) for a in scene]
-        avg_drift = np.median(drifts)
-        for a in scene:
-            a['final_start'] = a['orig_start'] + avg_drift
-            smoothed.append(a)
-    return smoothed
+    scene_drifts = [np.median(scene) for scene in np.split(anchors.drift, breaks)]
+    final_start = anchors.orig_start + np.repeat(scene_drifts, np.diff(bounds))
+    return replace(anchors, final_start=final_start)
 
 def enforce_strict_spacing(subs):
-    console.print("[dim]   🧹 Running Zipper (Overlap Cleanup)...[/dim]")
+    """Sorts subs and pushes overlapping lines apart. Returns (subs, number of fixes)."""
+    if VERBOSE: console.print("[dim]   🧹 Running Zipper (Overlap Cleanup)...[/dim]")
     subs.sort()
     fix_count = 0
     
-    for i in range(1, len(subs)):
-        prev = subs[i-1]
-        curr = subs[i]
-        required_start = prev.end + GAP_MS
+    # Work on plain int columns; touching event attributes in the loop is the slow part
+    starts = [event.start for event in subs]
+    ends = [event.end for event in subs]
+    
+    for i in range(1, len(starts)):
+        required_start = ends[i-1] + GAP_MS
         
-        if required_start > curr.start:
-            new_prev_end = curr.start - GAP_MS
-            prev_duration = new_prev_end - prev.start
+        if required_start > starts[i]:
+            new_prev_end = starts[i] - GAP_MS
+            prev_duration = new_prev_end - starts[i-1]
             
             if prev_duration < MIN_DURATION_MS:
-                prev.end = prev.start + MIN_DURATION_MS
-                curr.start = prev.end + GAP_MS
-                curr_dur = curr.end - curr.start
-                curr.end = curr.start + curr_dur
+                # Push the current line back; its end stays where it was
+                ends[i-1] = starts[i-1] + MIN_DURATION_MS
+                starts[i] = ends[i-1] + GAP_MS
             else:
-                prev.end = new_prev_end
+                ends[i-1] = new_prev_end
             fix_count += 1
-            
-    console.print(f"[dim]      ➡️ 🔧 Resolved {fix_count} overlaps.[/dim]")
-    return subs
+    
+    if fix_count:
+        for event, start, end in zip(subs, starts, ends):
+            event.start = start
+            event.end = end
+
+    return subs, fix_count
+
+def rolling_median(values, half_window):
+    """
+    Median of each element's neighbourhood [i - half_window, i + half_window],
+    truncated at the edges. Full windows are handled by one vectorized partition.
+    """
+    n = len(values)
+    size = 2 * half_window + 1
+    medians = np.empty(n, dtype=np.float64)
+    
+    # Full windows have odd length, so the median is just the middle order statistic
+    if n >= size:
+        windows = np.lib.stride_tricks.sliding_window_view(values, size)
+        medians[half_window:n - half_window] = np.partition(windows, half_window, axis=1)[:, half_window]
+    
+    # At most 2 * half_window truncated windows at the ends
+    for i in (*range(min(half_window, n)), *range(max(half_window, n - half_window), n)):
+        medians[i] = np.median(values[max(0, i - half_window):i + half_window + 1])
+    return medians
+
+def copy_timestamps(target_subs, timed_subs):
+    """
+    Copies start/end from timed_subs onto target_subs, event by event.
+    Used to put synced timings from a translated ghost back on the original.
+    """
+    # attrgetter pulls both fields in C instead of two Python attribute reads per event
+    for event, (start, end) in zip(target_subs, map(attrgetter("start", "end"), timed_subs)):
+        event.start = start
+        event.end = end
+    return target_subs
+
+def _intern_tokens(sub_strs, wh_strs):
+    """Maps each distinct word to a small int so the matcher compares ints, not strings."""
+    vocab = {}
+    sub_ids = [vocab.setdefault(w, len(vocab)) for w in sub_strs]
+    wh_ids = [vocab.setdefault(w, len(vocab)) for w in wh_strs]
+    return sub_ids, wh_ids
+
+def _matching_blocks(a, b):
+    """
+    Returns (a_start, b_start, size) runs of equal tokens between a and b.
+    Uses rapidfuzz's LCS when available, otherwise difflib (autojunk off).
+    """
+    if Indel is not None:
+        return [(i1, j1, i2 - i1) for tag, i1, i2, j1, j2 in Indel.opcodes(a, b) if tag == "equal"]
+    matcher = difflib.SequenceMatcher(None, a, b, autojunk=False)
+    return [(m.a, m.b, m.size) for m in matcher.get_matching_blocks() if m.size]
 
 class GlobalAligner:
     def __init__(self, original_subs, whisper_data):
@@ -71,109 +148,109 @@ class GlobalAligner:
         self.whisper = whisper_data
         
     def _tokenize_subs(self):
-        sub_words = []
+        """Returns (words, sub_idx): every cleaned word and the subtitle line it came from."""
+        words = []
+        sub_idx = array.array('i')
         for idx, sub in enumerate(self.subs):
-            text = clean_text(sub.text) 
-            words = text.split()
-            for i, w in enumerate(words):
-                if w.strip():
-                    sub_words.append({"word": w.strip(), "sub_idx": idx})
-        return sub_words
+            line_words = clean_text(sub.text).split()
+            words.extend(line_words)
+            sub_idx.extend([idx] * len(line_words))
+        return words, np.frombuffer(sub_idx, dtype=np.int32)
 
     def _tokenize_whisper(self):
-        whisper_words = []
+        """Returns (words, starts): every cleaned whisper word and its start time in seconds."""
+        words = []
+        starts = array.array('d')
         for seg in self.whisper:
             if 'words' in seg and seg['words']:
                 for w in seg['words']:
                     if 'start' in w:
-                        whisper_words.append({"word": clean_text(w['word']), "start": w['start']})
+                        words.append(_clean_word(w['word']))
+                        starts.append(w['start'])
             else:
-                text = clean_text(seg['text'])
-                words = text.split()
-                if not words: continue
+                seg_words = clean_text(seg['text']).split()
+                if not seg_words: continue
                 duration = seg['end'] - seg['start']
-                wd = duration / len(words)
-                for i, w in enumerate(words):
-                    whisper_words.append({"word": w.strip(), "start": seg['start'] + i*wd})
-        return whisper_words
+                wd = duration / len(seg_words)
+                words.extend(seg_words)
+                starts.extend(seg['start'] + i*wd for i in range(len(seg_words)))
+        return words, np.frombuffer(starts, dtype=np.float64)
 
     def run(self):
-        console.print("[dim]   🧩 Tokenizing data...[/dim]")
-        sub_tokens = self._tokenize_subs()
-        wh_tokens = self._tokenize_whisper()
-        
-        sub_strs = [x['word'] for x in sub_tokens]
-        wh_strs = [x['word'] for x in wh_tokens]
+        if VERBOSE: console.print("[dim]   🧩 Tokenizing data...[/dim]")
+        sub_strs, sub_idx = self._tokenize_subs()
+        wh_strs, wh_starts = self._tokenize_whisper()
 
-        console.print(f"[dim]   📐 Global Alignment ({len(sub_strs)} vs {len(wh_strs)} words)...[/dim]")
-        matcher = difflib.SequenceMatcher(None, sub_strs, wh_strs, autojunk=False)
-        matches = matcher.get_matching_blocks()
+        if VERBOSE: console.print(f"[dim]   📐 Global Alignment ({len(sub_strs)} vs {len(wh_strs)} words)...[/dim]")
+        matches = _matching_blocks(*_intern_tokens(sub_strs, wh_strs))
         
-        sub_matches = {i: [] for i in range(len(self.subs))}
-        for match in matches:
-            for i in range(match.size):
-                sub_token = sub_tokens[match.a + i]
-                wh_time = wh_tokens[match.b + i]['start']
-                sub_matches[sub_token['sub_idx']].append(wh_time)
-
-        candidates = []
-        for idx in range(len(self.subs)):
-            if sub_matches[idx]:
-                sub = self.subs[idx]
-                match_start = sub_matches[idx][0]
-                drift = match_start - (sub.start / 1000.0)
-                candidates.append({
-                    'idx': idx, 'orig_start': sub.start/1000.0, 
-                    'raw_match_time': match_start, 'drift': drift
-                })
-
-        if not candidates: return None, 0
-
-        console.print("[dim]   🔍 Applying Rolling Window Drift Filter...[/dim]")
-        raw_anchors = []
-        rejected_count = 0
+        if not matches: return None, 0
+
+        n_subs = len(self.subs)
+        starts = np.fromiter((sub.start for sub in self.subs), dtype=np.float64, count=n_subs) / 1000.0
+
+        # Every matched (sub token, whisper token) pair; each subtitle line is
+        # anchored by its first matched word
+        a_pos = np.concatenate([np.arange(a, a + size) for a, b, size in matches])
+        b_pos = np.concatenate([np.arange(b, b + size) for a, b, size in matches])
+        matched_idx, first = np.unique(sub_idx[a_pos], return_index=True)
+        match_start = wh_starts[b_pos[first]]
+
+        candidates = Anchors(
+            idx=matched_idx,
+            orig_start=starts[matched_idx],
+            raw_match=match_start,
+            drift=match_start - starts[matched_idx],
+        )
+
+        if VERBOSE: console.print("[dim]   🔍 Applying Rolling Window Drift Filter...[/dim]")
         window_size = 10 
         
-        for i, cand in enumerate(candidates):
-            start_i = max(0, i - window_size)
-            end_i = min(len(candidates), i + window_size + 1)
-            neighbors = [n['drift'] for n in candidates[start_i:end_i]]
-            
-            if abs(cand['drift'] - np.median(neighbors)) > OUTLIER_THRESHOLD_SEC:
-                rejected_count += 1
-            else:
-                raw_anchors.append(cand)
+        # Hampel identifier: scale the cut-off by the local MAD (1.4826 turns it
+        # into a robust sigma), so noisy stretches tolerate more drift than steady ones
+        deviation = np.abs(candidates.drift - rolling_median(candidates.drift, window_size))
+        mad = rolling_median(deviation, window_size)
+        threshold = np.maximum(OUTLIER_SIGMA * 1.4826 * mad, MIN_OUTLIER_SEC)
+        keep = deviation <= threshold
+        raw_anchors = candidates.select(keep)
+        rejected_count = len(candidates) - len(raw_anchors)
 
-        console.print(f"[dim]   ⚓️ Valid Anchors: {len(raw_anchors)} (Rejected {rejected_count} outliers)[/dim]")
-        
         anchors = smooth_offsets_by_block(raw_anchors)
         
-        console.print("[dim]   🔨 Reconstructing Timeline (Interpolation)...[/dim]")
+        if VERBOSE: console.print("[dim]   🔨 Reconstructing Timeline (Interpolation)...[/dim]")
         new_subs = pysubs2.SSAFile()
         new_subs.info = self.subs.info
         
-        xp = [a['orig_start'] for a in anchors]
-        fp = [a['final_start'] for a in anchors]
+        # Interpolate every start in one call; lines before the first / after the
+        # last anchor just carry that anchor's shift
+        durs = np.fromiter((sub.end - sub.start for sub in self.subs), dtype=np.float64, count=n_subs) / 1000.0
         
-        for i, sub in enumerate(self.subs):
-            orig = sub.start / 1000.0
-            dur = (sub.end - sub.start) / 1000.0
+        if len(anchors) > 0:
+            xp = anchors.orig_start
+            fp = anchors.final_start
+            new_starts = np.interp(starts, xp, fp)
             
-            if len(anchors) > 0:
-                if i < anchors[0]['idx']:
-                    shift = anchors[0]['final_start'] - anchors[0]['orig_start']
-                    new_start = orig + shift
-                elif i > anchors[-1]['idx']:
-                    shift = anchors[-1]['final_start'] - anchors[-1]['orig_start']
-                    new_start = orig + shift
-                else:
-                    new_start = np.interp(orig, xp, fp)
-            else:
-                new_start = orig
-            
-            sub.start = int(max(0, new_start) * 1000)
-            sub.end = int(max(0, new_start + dur) * 1000)
-            new_subs.append(sub)
+            positions = np.arange(n_subs)
+            head = positions < anchors.idx[0]
+            tail = positions > anchors.idx[-1]
+            new_starts[head] = starts[head] + (fp[0] - xp[0])
+            new_starts[tail] = starts[tail] + (fp[-1] - xp[-1])
+        else:
+            new_starts = starts
+        
+        # Clamp and convert to ms in NumPy; tolist() hands back plain ints
+        starts_ms = (np.maximum(0, new_starts) * 1000).astype(np.int64)
+        ends_ms = (np.maximum(0, new_starts + durs) * 1000).astype(np.int64)
+        for sub, start, end in zip(self.subs, starts_ms.tolist(), ends_ms.tolist()):
+            sub.start = start
+            sub.end = end
+        new_subs.events.extend(self.subs)
 
-        new_subs = enforce_strict_spacing(new_subs)
+        new_subs, fix_count = enforce_strict_spacing(new_subs)
+        
+        # One summary line instead of a print per stage
+        console.print(
+            f"[dim]   ⚓️ {len(sub_strs)} vs {len(wh_strs)} words → {len(raw_anchors)} anchors "
+            f"(Rejected {rejected_count} outliers, resolved {fix_count} overlaps)[/dim]"
+        )
         return new_subs, rejected_count
\ No newline at end of file
@@ -49,6 +49,12 @@ def parse_arguments():
         help="When used with --overwrite, creates a .bak copy of the original file before overwriting.",
         default=False
     )
+    parser.add_argument(
+        "--no-word-align",
+        action="store_true",
+        help="Skip phoneme (word-level) alignment and sync from segment timestamps. Faster, slightly less precise.",
+        default=False
+    )
 
     # Automation / Files
     parser.add_argument(
@@ -1,5 +1,6 @@
 import json
 from pathlib import Path
+from typing import NamedTuple, Optional
 
 # Define the config path in the user's home directory (~/.anchor/config.json)
 CONFIG_DIR = Path.home() / ".anchor"
@@ -73,4 +74,19 @@ def _merge_configs(default: dict, user: dict) -> dict:
             merged[key] = _merge_configs(merged[key], value)
         else:
             merged[key] = value     
-    return merged
\ No newline at end of file
+    return merged
+
+class ResolvedConfig(NamedTuple):
+    """Hardware settings after applying CLI args over config overrides."""
+    audio_model: Optional[str]
+    batch_size: Optional[int]
+    translation_model: Optional[str]
+
+def resolve_config(args, config: dict) -> ResolvedConfig:
+    """CLI arguments win; otherwise fall back to the config's hardware_overrides."""
+    hw_overrides = config.get("hardware_overrides") or {}
+    return ResolvedConfig(
+        audio_model=args.audio_model or hw_overrides.get("audio_model"),
+        batch_size=args.batch_size or hw_overrides.get("batch_size"),
+        translation_model=args.translation_model or hw_overrides.get("translation_model"),
+    )
@@ -1,10 +1,25 @@
 import json
+import os
 import subprocess
+from functools import lru_cache
 
 def get_subtitle_streams(file_path):
     """
     Scans a media file using ffprobe and returns a list of subtitle streams.
+    Results are cached per file path and modification time, so probing the same
+    unchanged file twice in one session only runs ffprobe once.
     """
+    try:
+        st = os.stat(file_path)
+    except OSError:
+        # Let ffprobe report the missing/unreadable file as usual
+        return _probe_subtitle_streams.__wrapped__(file_path, None, None)
+    
+    return _probe_subtitle_streams(file_path, st.st_mtime_ns, st.st_size)
+
+@lru_cache(maxsize=128)
+def _probe_subtitle_streams(file_path, mtime_ns, size):
+    # mtime_ns and size are only part of the cache key
     cmd = [
         "ffprobe",
         "-v", "error",
@@ -22,4 +37,4 @@ def get_subtitle_streams(file_path):
         return None
     except FileNotFoundError:
         # Catch if ffprobe is missing from the system path
-        return False
\ No newline at end of file
+        return False
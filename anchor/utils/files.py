@@ -1,3 +1,4 @@
+import os
 import re
 import curses
 import pysubs2
@@ -8,33 +9,43 @@ console = Console()
 
 VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".mov", ".flv", ".webm"}
 
-def get_files(extensions):
-    return sorted([f for f in Path.cwd().iterdir() if f.suffix.lower() in extensions], key=lambda f: f.name)
+# Trailing language / sync tags (Movie.en.hi.synced -> Movie), stripped in one pass
+_LANG_TOKEN_RE = re.compile(r'(?:\.(?:[a-z]{2,3}(?:-[a-z]{2})?|synced|sync|hi|ai))+$', flags=re.IGNORECASE)
 
-def find_best_video_match(sub_path):
+def get_files(extensions, directory=None):
+    # scandir hands back cached names/types, so only matching entries become Paths.
+    # endswith() with a tuple does the suffix test in C, one lower() per name.
+    suffixes = tuple(extensions)
+    cwd = Path(directory) if directory is not None else Path.cwd()
+    with os.scandir(cwd) as it:
+        names = [e.name for e in it if e.name.lower().endswith(suffixes) and e.is_file()]
+    names.sort()
+    return [cwd / name for name in names]
+
+def build_video_index(videos):
+    """
+    Pairs each video with its lowercased name so fuzzy matching doesn't
+    re-lowercase every filename for every subtitle.
+    """
+    return [(vid.name.lower(), vid) for vid in videos]
+
+def find_best_video_match(sub_path, video_index=None):
     """
     Smart matching: Handles language codes (Movie.en.srt -> Movie.mp4)
+    Pass a pre-built `video_index` (see build_video_index) when matching many
+    subtitles to avoid re-listing the directory for every call.
     """
-    clean_name = sub_path.stem
-    token_re = re.compile(r'(?:\.(?:[a-z]{2,3}(?:-[a-z]{2})?|synced|sync|hi|ai))$', flags=re.IGNORECASE)
-    
-    while True:
-        new_name = token_re.sub('', clean_name)
-        if new_name == clean_name:
-            break
-        clean_name = new_name
+    clean_name = _LANG_TOKEN_RE.sub('', sub_path.stem)
 
     for ext in VIDEO_EXTENSIONS:
         candidate = sub_path.with_name(clean_name + ext)
         if candidate.exists():
             return candidate
 
-    videos = get_files(VIDEO_EXTENSIONS)
-    for vid in videos:
-        if clean_name.lower() in vid.name.lower():
-            return vid
-            
-    return None
+    if video_index is None:
+        video_index = build_video_index(get_files(VIDEO_EXTENSIONS))
+    clean_lower = clean_name.lower()
+    return next((vid for name, vid in video_index if clean_lower in name), None)
 
 def backup_if_needed(path: Path, args) -> None:
     if args and getattr(args, "backup", False) and path.exists():
@@ -54,11 +65,18 @@ def open_subtitle(path: Path, **kwargs) -> pysubs2.SSAFile:
         "iso-8859-2", "iso-8859-5", "iso-8859-15"
     ]
     
-    path_str = str(path)
+    # Read the file once; each encoding attempt only decodes and parses in memory
+    try:
+        raw = Path(path).read_bytes()
+    except OSError as e:
+        raw = None
+        last_error = e
     
-    for enc in encodings:
+    for enc in encodings if raw is not None else ():
         try:
-            return pysubs2.load(path_str, encoding=enc, **kwargs)
+            # Same universal-newline handling as opening the file in text mode
+            text = raw.decode(enc).replace('\r\n', '\n').replace('\r', '\n')
+            return pysubs2.SSAFile.from_string(text, **kwargs)
         except Exception as e:
             last_error = e
             continue
@@ -96,12 +114,13 @@ def select_files_interactive(files, header_lines=None, multi_select=True):
     indices = _run_curses_picker(options, title="Select", multi_select=multi_select, header_lines=header_lines)
     return [files[i] for i in indices]
 
-def select_video_fallback(sub_filename, header_lines=None):
+def select_video_fallback(sub_filename, header_lines=None, videos=None):
     """
     Single-select picker for video files.
     Returns a single Path object or None.
     """
-    videos = get_files(VIDEO_EXTENSIONS)
+    if videos is None:
+        videos = get_files(VIDEO_EXTENSIONS)
     if not videos:
         console.print("[red]No video files found![/red]")
         return None
@@ -124,6 +143,9 @@ def _run_curses_picker(options, title="Select Files", multi_select=True, header_
     """
     return curses.wrapper(_picker_loop, options, title, multi_select, header_lines)
 
+# Rich-style colour tags the picker understands inside option labels
+_COLOR_TAG_RE = re.compile(r'(\[/?(?:green|red|yellow|blue|white|magenta)\])')
+
 def _picker_loop(stdscr, options, title, multi_select, header_lines):
     # 1. Setup
     curses.curs_set(0) # Hide cursor
@@ -156,6 +178,11 @@ def _picker_loop(stdscr, options, title, multi_select, header_lines):
         '[magenta]': curses.color_pair(15) | curses.A_BOLD,
     }
 
+    # Options never change while the picker is open, so tokenize them once
+    # instead of re-running the tag regexes on every redraw.
+    option_parts = [_COLOR_TAG_RE.split(opt) for opt in options]
+    option_clean = [_COLOR_TAG_RE.sub('', opt) for opt in options]
+
     current_row = 0
     selected_indices = set()
     offset = 0
@@ -212,10 +239,10 @@ def _picker_loop(stdscr, options, title, multi_select, header_lines):
                 if not multi_select and is_hovered: 
                     checkbox = "(*)"
 
-            row_raw = f" {checkbox} {options[idx]}"
+            prefix = f" {checkbox} "
             
             # Strip tags to calculate the "true" string length
-            row_clean = re.sub(r'\[/?(?:green|red|yellow|blue|white|magenta)\]', '', row_raw)
+            row_clean = prefix + option_clean[idx]
 
             # DRAWING STYLES
             if is_hovered:
@@ -228,7 +255,8 @@ def _picker_loop(stdscr, options, title, multi_select, header_lines):
                 stdscr.attroff(curses.color_pair(3))
             else:
                 # Normal Rows: Parse the string chunk by chunk and paint the colors
-                parts = re.split(r'(\[/?(?:green|red|yellow|blue|white|magenta)\])', row_raw)
+                first, *rest = option_parts[idx]
+                parts = [prefix + first, *rest]
                 base_style = curses.color_pair(1) | curses.A_BOLD if is_checked else curses.color_pair(5) | curses.A_DIM
                 current_style = base_style
                 
@@ -10,9 +10,13 @@ def format_timestamp(ms: int) -> str:
     s = seconds % 60
     return f"{h:02}:{m:02}:{s:06.3f}".replace('.', ',')
 
+_ASS_TAG_RE = re.compile(r'\{.*?\}')
+_HTML_TAG_RE = re.compile(r'<.*?>')
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
 def clean_text(text: str) -> str:
-    t = re.sub(r'\{.*?\}', '', text) 
-    t = re.sub(r'<.*?>', '', t)
-    t = re.sub(r'\\N', ' ', t)
-    t = re.sub(r'[^\w\s]', '', t)
+    t = _ASS_TAG_RE.sub('', text)
+    t = _HTML_TAG_RE.sub('', t)
+    t = t.replace('\\N', ' ')
+    t = _PUNCT_RE.sub('', t)
     return t.lower().strip()
\ No newline at end of file
@@ -4,10 +4,10 @@ import subprocess
 
 
 def get_video_info(video_path: Path):
-    """Uses ffprobe to extract the video codec and bitrate."""
+    """Uses ffprobe to extract the video codec, bitrate and duration (seconds)."""
     cmd = [
         "ffprobe", "-v", "error", "-select_streams", "v:0",
-        "-show_entries", "stream=codec_name,bit_rate:format=bit_rate",
+        "-show_entries", "stream=codec_name,bit_rate:format=bit_rate,duration",
         "-of", "json", str(video_path)
     ]
     try:
@@ -21,6 +21,7 @@ def get_video_info(video_path: Path):
         
         # Try to get stream bitrate first, fallback to overall format bitrate
         bitrate = stream.get("bit_rate") or fmt.get("bit_rate")
-        return codec, bitrate
+        duration = float(fmt["duration"]) if fmt.get("duration") else None
+        return codec, bitrate, duration
     except Exception:
-        return "h264", None
\ No newline at end of file
+        return "h264", None, None
\ No newline at end of file
@@ -2,8 +2,6 @@ import gc
 import sys
 import time
 import os
-import torch
-import whisperx
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 from .ui import make_ui_console, CaptureProgress
@@ -12,7 +10,12 @@ from .alignment import GlobalAligner
 
 console = Console()
 
+# torch / whisperx are imported inside the functions that run inference, so
+# importing this module (e.g. for run_anchor_align_and_sync) stays cheap.
+
 def load_whisper_model(device, compute_type, language, model_size="large-v3"):
+    import whisperx
+
     # Safe console capture: duplicate stdout and wrap in a file object
     real_stdout_fd = os.dup(1)
     safe_file = os.fdopen(real_stdout_fd, "w")
@@ -49,8 +52,17 @@ def load_whisper_model(device, compute_type, language, model_size="large-v3"):
 
     return model
 
-def run_whisper_transcription(video_path, device, compute_type, batch_size, model, language=None):
-    """Transcribes audio and aligns phonemes. Returns (whisper_data, detected_lang) or (None, None) on failure."""
+def run_whisper_transcription(video_path, device, compute_type, batch_size, model, language=None, align_cache=None, align_words=True):
+    """
+    Transcribes audio and aligns phonemes. Returns (whisper_data, detected_lang) or (None, None) on failure.
+    Pass a dict as `align_cache` to keep the alignment model loaded between calls;
+    it holds one language at a time, which suits a queue grouped by language.
+    With `align_words=False` the phoneme pass is skipped and the aligner spreads
+    segment timestamps across the words instead.
+    """
+    import torch
+    import whisperx
+
     safe_console = Console(force_terminal=True)
     try:
         audio = whisperx.load_audio(str(video_path))
@@ -58,6 +70,14 @@ def run_whisper_transcription(video_path, device, compute_type, batch_size, mode
         safe_console.print(f"[bold red]❌ Failed to load audio: {e}[/bold red]")
         return None, None
 
+    if device == "cuda":
+        # Page-locked host memory lets the VAD and alignment chunk uploads DMA
+        # straight to the GPU instead of going through a staging copy
+        try:
+            audio = torch.from_numpy(audio).pin_memory().numpy()
+        except RuntimeError:
+            pass
+
     result = None
     current_batch_size = batch_size
     is_windows = (os.name != 'posix')
@@ -117,45 +137,59 @@ def run_whisper_transcription(video_path, device, compute_type, batch_size, mode
     if not result:
         return None, None
 
-    del audio
-    gc.collect()
+    # Keep the decoded audio (host RAM) for alignment; only drop cached VRAM here
     if device == "cuda": torch.cuda.empty_cache()
 
     detected_lang = result.get("language", "unknown")
     console.print(f"[dim]📝 Transcription complete. [bold cyan]Detected language: {detected_lang.upper()}[/bold cyan][/dim]")
 
-    # Align Phonemes
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        TimeElapsedColumn(),
-        console=console,
-        transient=True
-    ) as progress:
-        progress.add_task("[cyan] Aligning phonemes...", total=None)
-
-        try:
-            model_a, metadata = whisperx.load_align_model(language_code=detected_lang, device=device)
-            audio_for_align = whisperx.load_audio(str(video_path))
-
-            aligned_result = whisperx.align(
-                result["segments"],
-                model_a,
-                metadata,
-                audio_for_align,
-                device,
-                return_char_alignments=False,
-            )
-            segments = aligned_result["segments"]
-
-            del model_a; del audio_for_align; gc.collect()
-            if device == "cuda": torch.cuda.empty_cache()
-
-        except Exception as e:
-            console.print(f"[yellow]⚠️ Phoneme alignment failed ({e}). Using raw timestamps.[/yellow]")
-            segments = result["segments"]
+    if align_words:
+        # Align Phonemes
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            TimeElapsedColumn(),
+            console=console,
+            transient=True
+        ) as progress:
+            progress.add_task("[cyan] Aligning phonemes...", total=None)
+
+            try:
+                if align_cache is not None and detected_lang in align_cache:
+                    model_a, metadata = align_cache[detected_lang]
+                else:
+                    if align_cache:
+                        # Language changed: let go of the previous model before loading
+                        align_cache.clear()
+                        if device == "cuda": torch.cuda.empty_cache()
+                    model_a, metadata = whisperx.load_align_model(language_code=detected_lang, device=device)
+                    if align_cache is not None:
+                        align_cache[detected_lang] = (model_a, metadata)
+
+                aligned_result = whisperx.align(
+                    result["segments"],
+                    model_a,
+                    metadata,
+                    audio,
+                    device,
+                    return_char_alignments=False,
+                )
+                segments = aligned_result["segments"]
+
+                if align_cache is None:
+                    del model_a; gc.collect()
+                    if device == "cuda": torch.cuda.empty_cache()
+
+            except Exception as e:
+                console.print(f"[yellow]⚠️ Phoneme alignment failed ({e}). Using raw timestamps.[/yellow]")
+                segments = result["segments"]
+
+        console.print("[dim]📏 Phoneme alignment complete.[/dim]")
+    else:
+        console.print("[dim]⏭️ Word alignment skipped. Using segment timestamps.[/dim]")
+        segments = result["segments"]
 
-    console.print("[dim]📏 Phoneme alignment complete.[/dim]")
+    del audio
 
     whisper_data = [
         {'start': seg['start'], 'end': seg['end'], 'text': seg['text'], 'words': seg.get('words', [])}